@@ -0,0 +1,37 @@
+"""Mixin that coalesces spin-box driven item updates in the property editors."""
+
+from PySide6.QtCore import QTimer
+
+
+class DeferredUpdateMixin:
+    """
+    Holding an arrow key or typing into a spin box fires valueChanged for
+    every step.  Instead of touching the item (and refreshing the component
+    list) each time, editors queue the change and it is applied once on the
+    next event-loop tick.
+
+    Call _init_deferred_updates() from __init__ and route valueChanged
+    handlers through _queue_update().  Each queued callable runs at most
+    once per flush and should read the latest value from its spin box.
+    """
+
+    def _init_deferred_updates(self):
+        self._pending_updates: dict = {}   # apply callable -> notify flag
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(0)
+        self._update_timer.timeout.connect(self.flush_pending_updates)
+
+    def _queue_update(self, apply, notify: bool = True):
+        """Schedule *apply*; update_callback() runs afterwards if *notify*."""
+        self._pending_updates[apply] = notify or self._pending_updates.get(apply, False)
+        self._update_timer.start()
+
+    def flush_pending_updates(self):
+        """Apply every queued change now (also used before the editor goes away)."""
+        self._update_timer.stop()
+        pending, self._pending_updates = self._pending_updates, {}
+        for apply in pending:
+            apply()
+        if any(pending.values()):
+            self.update_callback()
@@ -1,5 +1,7 @@
 """Property editors for Line, Rectangle, and Barcode scene items."""
 
+from functools import partial
+
 from PySide6.QtWidgets import (
     QWidget, QFormLayout, QLabel, QLineEdit, QSizePolicy, QHBoxLayout,
     QFrame, QScrollArea, QVBoxLayout, QPushButton, QTextEdit,
@@ -13,6 +15,7 @@ from components.barcode_editor.utils import (
 )
 from components.barcode_editor.scene_items import BarcodeItem
 from components.barcode_editor.merge_konversi_mixin import MergeInputWidget
+from components.barcode_editor.deferred_update_mixin import DeferredUpdateMixin
 
 LABEL_W = 70
 
@@ -27,13 +30,15 @@ _DISABLED_COMBO_STYLE = """
 """
 
 
+_LABEL_STYLE = (
+    f"color: {COLORS['legacy_blue']}; font-size: 9px; text-transform: uppercase; "
+    "background: transparent; border: none;"
+)
+
+
 def _lbl(text: str) -> QLabel:
-    label_style = (
-        f"color: {COLORS['legacy_blue']}; font-size: 9px; text-transform: uppercase; "
-        "background: transparent; border: none;"
-    )
     l = QLabel(text)
-    l.setStyleSheet(label_style)
+    l.setStyleSheet(_LABEL_STYLE)
     l.setFixedWidth(LABEL_W)
     l.setAlignment(Qt.AlignLeft | Qt.AlignBottom)
     return l
@@ -95,14 +100,14 @@ class InlineChecklistWidget(QWidget):
         self._btn_up.setStyleSheet(_arrow_style)
         self._btn_up.setCursor(Qt.PointingHandCursor)
         self._btn_up.setFocusPolicy(Qt.NoFocus)
-        self._btn_up.clicked.connect(lambda: self._move_focused(-1))
+        self._btn_up.clicked.connect(self._move_focused_up)
 
         self._btn_dn = QPushButton("▼")
         self._btn_dn.setFixedSize(14, 16)
         self._btn_dn.setStyleSheet(_arrow_style)
         self._btn_dn.setCursor(Qt.PointingHandCursor)
         self._btn_dn.setFocusPolicy(Qt.NoFocus)
-        self._btn_dn.clicked.connect(lambda: self._move_focused(+1))
+        self._btn_dn.clicked.connect(self._move_focused_down)
 
         top_lay.addWidget(self._btn_all)
         top_lay.addWidget(self._btn_none)
@@ -274,6 +279,12 @@ class InlineChecklistWidget(QWidget):
         self._focused_name = name
         self._refresh_row_styles()
 
+    def _move_focused_up(self):
+        self._move_focused(-1)
+
+    def _move_focused_down(self):
+        self._move_focused(+1)
+
     def _move_focused(self, direction: int):
         name = self._focused_name
         if not name or name not in self._items:
@@ -311,12 +322,13 @@ class InlineChecklistWidget(QWidget):
 
 # ── LinePropertyEditor ────────────────────────────────────────────────────────
 
-class LinePropertyEditor(QWidget):
+class LinePropertyEditor(DeferredUpdateMixin, QWidget):
     def __init__(self, target_item, update_callback):
         super().__init__()
         self.item = target_item
         self.update_callback = update_callback
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+        self._init_deferred_updates()
 
         layout = QFormLayout(self)
         layout.setContentsMargins(10, 10, 10, 10)
@@ -338,8 +350,8 @@ class LinePropertyEditor(QWidget):
 
         self.top_spin  = make_spin(0, 5000, int(self.item.pos().y()))
         self.left_spin = make_spin(0, 5000, int(self.item.pos().x()))
-        self.top_spin.editingFinished.connect(lambda: self.item.setY(self.top_spin.value()))
-        self.left_spin.editingFinished.connect(lambda: self.item.setX(self.left_spin.value()))
+        self.top_spin.editingFinished.connect(self._apply_top)
+        self.left_spin.editingFinished.connect(self._apply_left)
         layout.addRow(_lbl("TOP :"),  self.top_spin)
         layout.addRow(_lbl("LEFT :"), self.left_spin)
 
@@ -350,14 +362,24 @@ class LinePropertyEditor(QWidget):
         layout.addRow(_lbl("VISIBLE :"), self.visible_combo)
 
     def update_geometry(self):
-        self.item.setLine(0, 0, self.width_spin.value(), 0)
-        self.update_callback()
+        self._queue_update(self._apply_geometry)
 
     def update_thickness(self, value: int):
+        self._queue_update(self._apply_thickness)
+
+    def _apply_geometry(self):
+        self.item.setLine(0, 0, self.width_spin.value(), 0)
+
+    def _apply_thickness(self):
         pen = self.item.pen()
-        pen.setWidth(value)
+        pen.setWidth(self.thickness_spin.value())
         self.item.setPen(pen)
-        self.update_callback()
+
+    def _apply_top(self):
+        self.item.setY(self.top_spin.value())
+
+    def _apply_left(self):
+        self.item.setX(self.left_spin.value())
 
     def update_position_fields(self, pos):
         if self.top_spin.hasFocus() or self.left_spin.hasFocus():
@@ -376,12 +398,13 @@ class LinePropertyEditor(QWidget):
 
 # ── RectanglePropertyEditor ───────────────────────────────────────────────────
 
-class RectanglePropertyEditor(QWidget):
+class RectanglePropertyEditor(DeferredUpdateMixin, QWidget):
     def __init__(self, target_item, update_callback):
         super().__init__()
         self.item = target_item
         self.update_callback = update_callback
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+        self._init_deferred_updates()
 
         layout = QFormLayout(self)
         layout.setContentsMargins(10, 10, 10, 10)
@@ -402,8 +425,8 @@ class RectanglePropertyEditor(QWidget):
 
         self.top_spin  = make_spin(0, 5000, int(self.item.pos().y()))
         self.left_spin = make_spin(0, 5000, int(self.item.pos().x()))
-        self.top_spin.editingFinished.connect(lambda: self.item.setY(self.top_spin.value()))
-        self.left_spin.editingFinished.connect(lambda: self.item.setX(self.left_spin.value()))
+        self.top_spin.editingFinished.connect(self._apply_top)
+        self.left_spin.editingFinished.connect(self._apply_left)
         layout.addRow(_lbl("TOP :"),  self.top_spin)
         layout.addRow(_lbl("LEFT :"), self.left_spin)
 
@@ -421,14 +444,24 @@ class RectanglePropertyEditor(QWidget):
         layout.addRow(_lbl("COLUMN :"), self.column_spin)
 
     def update_geometry(self):
-        self.item.setRect(0, 0, self.width_spin.value(), self.height_spin.value())
-        self.update_callback()
+        self._queue_update(self._apply_geometry)
 
     def update_border(self, width: int):
+        self._queue_update(self._apply_border)
+
+    def _apply_geometry(self):
+        self.item.setRect(0, 0, self.width_spin.value(), self.height_spin.value())
+
+    def _apply_border(self):
         pen = self.item.pen()
-        pen.setWidth(width)
+        pen.setWidth(self.border_spin.value())
         self.item.setPen(pen)
-        self.update_callback()
+
+    def _apply_top(self):
+        self.item.setY(self.top_spin.value())
+
+    def _apply_left(self):
+        self.item.setX(self.left_spin.value())
 
     def update_position_fields(self, pos):
         if self.top_spin.hasFocus() or self.left_spin.hasFocus():
@@ -447,13 +480,14 @@ class RectanglePropertyEditor(QWidget):
 
 # ── BarcodePropertyEditor ─────────────────────────────────────────────────────
 
-class BarcodePropertyEditor(QWidget):
+class BarcodePropertyEditor(DeferredUpdateMixin, QWidget):
 
     def __init__(self, target_item, update_callback):
         super().__init__()
         self.item = target_item
         self.update_callback = update_callback
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+        self._init_deferred_updates()
 
         self._conn_map:  dict = {}
         self._table_map: dict = {}
@@ -474,9 +508,7 @@ class BarcodePropertyEditor(QWidget):
             self.height_cm_spin.setValue(float(_hcm))
         except Exception:
             pass
-        self.height_cm_spin.editingFinished.connect(
-            lambda: setattr(self.item, "design_height_cm", self.height_cm_spin.value())
-        )
+        self.height_cm_spin.editingFinished.connect(self._apply_height_cm)
         layout.addRow(_lbl("HEIGHT(CM) :"), self.height_cm_spin)
 
         # ── TOP / LEFT ────────────────────────────────────────────────────────
@@ -541,9 +573,7 @@ class BarcodePropertyEditor(QWidget):
         self.magnification_combo._current = _mag
         self.magnification_combo._label.setText(_mag)
         self.magnification_combo.blockSignals(False)
-        self.magnification_combo.currentTextChanged.connect(
-            lambda v: setattr(self.item, "design_magnification", v)
-        )
+        self.magnification_combo.currentTextChanged.connect(partial(setattr, self.item, "design_magnification"))
         layout.addRow(_lbl("MAGNIFICATION FACTOR :"), self.magnification_combo)
 
         # ── RATIO ─────────────────────────────────────────────────────────────
@@ -553,9 +583,7 @@ class BarcodePropertyEditor(QWidget):
         self.ratio_combo._current = _ratio
         self.ratio_combo._label.setText(_ratio)
         self.ratio_combo.blockSignals(False)
-        self.ratio_combo.currentTextChanged.connect(
-            lambda v: setattr(self.item, "design_ratio", v)
-        )
+        self.ratio_combo.currentTextChanged.connect(partial(setattr, self.item, "design_ratio"))
         layout.addRow(_lbl("RATIO :"), self.ratio_combo)
 
         # ── CHECK DIGIT ───────────────────────────────────────────────────────
@@ -601,9 +629,7 @@ class BarcodePropertyEditor(QWidget):
         self.editor_combo._current = _editor
         self.editor_combo._label.setText(_editor)
         self.editor_combo.blockSignals(False)
-        self.editor_combo.currentTextChanged.connect(
-            lambda v: setattr(self.item, "design_editor", v)
-        )
+        self.editor_combo.currentTextChanged.connect(partial(setattr, self.item, "design_editor"))
         layout.addRow(_lbl("EDITOR :"), self.editor_combo)
 
         # ── SYSTEM VALUE / EXTRA ──────────────────────────────────────────────
@@ -613,9 +639,7 @@ class BarcodePropertyEditor(QWidget):
         layout.addRow(_lbl("SYSTEM VALUE :"), self.system_value_combo)
         layout.addRow(_lbl("EXTRA :"),        self.system_extra_combo)
         self.system_value_combo.currentTextChanged.connect(self._on_system_value_changed)
-        self.system_extra_combo.currentTextChanged.connect(
-            lambda v: setattr(self.item, "design_system_extra", v)
-        )
+        self.system_extra_combo.currentTextChanged.connect(partial(setattr, self.item, "design_system_extra"))
         self._restore_system_values(
             getattr(self.item, "design_system_value", ""),
             getattr(self.item, "design_system_extra", ""),
@@ -638,9 +662,7 @@ class BarcodePropertyEditor(QWidget):
             self.same_with_combo.blockSignals(False)
         elif _sw:
             self.item.design_same_with = ""   # stale reference, clear it
-        self.same_with_combo.currentTextChanged.connect(
-            lambda v: setattr(self.item, "design_same_with", v)
-        )
+        self.same_with_combo.currentTextChanged.connect(partial(setattr, self.item, "design_same_with"))
         layout.addRow(_lbl("SAME WITH :"), self.same_with_combo)
 
         # ── LINK combo ────────────────────────────────────────────────────────
@@ -648,9 +670,7 @@ class BarcodePropertyEditor(QWidget):
         _lnk = getattr(self.item, "design_link", "")
         if _lnk and _lnk in self.link_combo._items:
             self.link_combo.setCurrentText(_lnk)
-        self.link_combo.currentTextChanged.connect(
-            lambda v: setattr(self.item, "design_link", v)
-        )
+        self.link_combo.currentTextChanged.connect(partial(setattr, self.item, "design_link"))
         layout.addRow(_lbl("LINK TO :"), self.link_combo)
 
         # ── MERGE WITH (MergeInputWidget — same as TextPropertyEditor) ────────
@@ -669,15 +689,9 @@ class BarcodePropertyEditor(QWidget):
             _sv = getattr(self.item, _attr, "")
             if _sv and _sv in _combo._items:
                 _combo.setCurrentText(_sv)
-        self.timbangan_combo.currentTextChanged.connect(
-            lambda v: setattr(self.item, "design_timbangan", v)
-        )
-        self.weight_combo.currentTextChanged.connect(
-            lambda v: setattr(self.item, "design_weight", v)
-        )
-        self.um_combo.currentTextChanged.connect(
-            lambda v: setattr(self.item, "design_um", v)
-        )
+        self.timbangan_combo.currentTextChanged.connect(partial(setattr, self.item, "design_timbangan"))
+        self.weight_combo.currentTextChanged.connect(partial(setattr, self.item, "design_weight"))
+        self.um_combo.currentTextChanged.connect(partial(setattr, self.item, "design_um"))
         layout.addRow(_lbl("TIMBANGAN :"), self.timbangan_combo)
         layout.addRow(_lbl("WEIGHT :"),    self.weight_combo)
         layout.addRow(_lbl("U/M :"),       self.um_combo)
@@ -711,12 +725,8 @@ class BarcodePropertyEditor(QWidget):
 
         self.group_combo.currentTextChanged.connect(self._on_group_changed)
         self.table_combo.currentTextChanged.connect(self._on_table_changed)
-        self.field_combo.currentTextChanged.connect(
-            lambda v: setattr(self.item, "design_field", v)
-        )
-        self.result_combo.currentTextChanged.connect(
-            lambda v: setattr(self.item, "design_result", v)
-        )
+        self.field_combo.currentTextChanged.connect(partial(setattr, self.item, "design_field"))
+        self.result_combo.currentTextChanged.connect(partial(setattr, self.item, "design_result"))
 
         def _on_query_changed():
             v = self.table_extra.toPlainText()
@@ -738,21 +748,21 @@ class BarcodePropertyEditor(QWidget):
         self.text_input.setStyleSheet(MODERN_INPUT_STYLE)
         self.text_input.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self.text_input.setText(getattr(self.item, "design_text", "") or "")
-        self.text_input.textChanged.connect(lambda v: setattr(self.item, "design_text", v))
+        self.text_input.textChanged.connect(partial(setattr, self.item, "design_text"))
         layout.addRow(_lbl("TEXT :"), self.text_input)
 
         self.caption_input = QLineEdit()
         self.caption_input.setStyleSheet(MODERN_INPUT_STYLE)
         self.caption_input.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self.caption_input.setText(getattr(self.item, "design_caption", "") or "")
-        self.caption_input.textChanged.connect(lambda v: setattr(self.item, "design_caption", v))
+        self.caption_input.textChanged.connect(partial(setattr, self.item, "design_caption"))
         layout.addRow(_lbl("CAPTION :"), self.caption_input)
 
         self.format_input = QLineEdit()
         self.format_input.setStyleSheet(MODERN_INPUT_STYLE)
         self.format_input.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self.format_input.setText(getattr(self.item, "design_format", "") or "")
-        self.format_input.textChanged.connect(lambda v: setattr(self.item, "design_format", v))
+        self.format_input.textChanged.connect(partial(setattr, self.item, "design_format"))
         layout.addRow(_lbl("FORMAT :"), self.format_input)
 
         # ── VISIBLE ───────────────────────────────────────────────────────────
@@ -769,9 +779,7 @@ class BarcodePropertyEditor(QWidget):
         self.save_field_combo._current = _sf
         self.save_field_combo._label.setText(_sf)
         self.save_field_combo.blockSignals(False)
-        self.save_field_combo.currentTextChanged.connect(
-            lambda v: setattr(self.item, "design_save_field", v)
-        )
+        self.save_field_combo.currentTextChanged.connect(partial(setattr, self.item, "design_save_field"))
         layout.addRow(_lbl("SAVE FIELD :"), self.save_field_combo)
 
         self.column_spin = make_spin(1, 999, 1)
@@ -780,16 +788,14 @@ class BarcodePropertyEditor(QWidget):
             self.column_spin.setValue(int(_col))
         except (TypeError, ValueError):
             pass
-        self.column_spin.valueChanged.connect(lambda v: setattr(self.item, "design_column", v))
+        self.column_spin.valueChanged.connect(partial(setattr, self.item, "design_column"))
         layout.addRow(_lbl("COLUMN :"), self.column_spin)
 
         self.mandatory_combo = make_chevron_combo(["FALSE", "TRUE"])
         self.mandatory_combo.setCurrentText(
             getattr(self.item, "design_mandatory", "FALSE") or "FALSE"
         )
-        self.mandatory_combo.currentTextChanged.connect(
-            lambda v: setattr(self.item, "design_mandatory", v)
-        )
+        self.mandatory_combo.currentTextChanged.connect(partial(setattr, self.item, "design_mandatory"))
         layout.addRow(_lbl("MANDATORY :"), self.mandatory_combo)
 
         # ── BATCH NO / WH combos ──────────────────────────────────────────────
@@ -823,17 +829,20 @@ class BarcodePropertyEditor(QWidget):
         # ── Apply initial enable/disable + editor lock state ──────────────────
         self._on_type_changed(_type)
 
+    def _apply_height_cm(self):
+        self.item.design_height_cm = self.height_cm_spin.value()
+
     # ── Visual position helpers ───────────────────────────────────────────────
 
     def _on_top_value_changed(self, value: int):
         if not self.top_spin.hasFocus():
             return  # ignore programmatic updates
-        self._move_to_visual_locked(target_y=value)
+        self._queue_update(self._on_top_editing_finished, notify=False)
 
     def _on_left_value_changed(self, value: int):
         if not self.left_spin.hasFocus():
             return  # ignore programmatic updates
-        self._move_to_visual_locked(target_x=value)
+        self._queue_update(self._on_left_editing_finished, notify=False)
         
     def _get_aabb_offset(self):
         aabb = self.item.mapToScene(self.item.boundingRect()).boundingRect()
@@ -860,10 +869,12 @@ class BarcodePropertyEditor(QWidget):
 
     def _move_to_visual(self, target_x=None, target_y=None, block=False):
         off_x, off_y = self._get_aabb_offset()
-        if target_x is not None:
-            self.item.setX(target_x - off_x)
-        if target_y is not None:
-            self.item.setY(target_y - off_y)
+        pos = self.item.pos()
+        new_x = pos.x() if target_x is None else target_x - off_x
+        new_y = pos.y() if target_y is None else target_y - off_y
+        # One setPos, so an angle or type change that moves both axes costs a
+        # single ItemPositionChange (clamp + move callback) and scene update
+        self.item.setPos(new_x, new_y)
         if block:
             self.update_position_fields()
 
@@ -912,9 +923,7 @@ class BarcodePropertyEditor(QWidget):
         stored = getattr(self.item, "design_merge", "")
         if stored:
             combo.set_selected(stored)
-        combo.templateChanged.connect(
-            lambda tmpl: setattr(self.item, "design_merge", tmpl)
-        )
+        combo.templateChanged.connect(partial(setattr, self.item, "design_merge"))
         return combo
 
     # ── SYSTEM VALUE helpers ──────────────────────────────────────────────────
@@ -1323,11 +1332,10 @@ class BarcodePropertyEditor(QWidget):
     # ── Barcode type change ───────────────────────────────────────────────────
 
     def _update_barcode_type(self, new_design: str):
-        _2D = {"AZTEC (2D)", "DATA MATRIX (2D)", "QR (2D)"}
         old_design = self.item.design
         self.item.design = new_design
-        was_2d = old_design in _2D
-        is_2d  = new_design in _2D
+        was_2d = BarcodeItem.is_2d_design(old_design)
+        is_2d  = BarcodeItem.is_2d_design(new_design)
         if was_2d != is_2d:
             saved_left = self.left_spin.value()
             saved_top  = self.top_spin.value()
@@ -11,15 +11,39 @@ from PySide6.QtGui import QColor, QPen, QBrush, QFont, QPainter, QPainterPath
 
 from components.barcode_editor.utils import keep_within_bounds
 
+# Selection highlight and inverse-text colours shared by the canvas items
+_SELECTED_COLOR    = QColor("#EF4444")
+_INVERSE_BG_BRUSH  = QBrush(QColor("#000000"))
+_INVERSE_TEXT      = QColor("#FFFFFF")
 
-class SelectableTextItem(QGraphicsTextItem):
+
+class _BoundedItemMixin:
+    """
+    Keeps a movable canvas item inside the scene rect.
+
+    Clamping is enabled by setup_item_logic(), which stores the move callback
+    in ``_on_move``; until then itemChange behaves as the Qt base class.
+    """
+
+    _on_move = None
+
+    def itemChange(self, change, value):
+        if (change == QGraphicsItem.ItemPositionChange
+                and self._on_move is not None and self.scene()):
+            new_pos = keep_within_bounds(self, value)
+            self._on_move(new_pos)
+            return new_pos
+        return super().itemChange(change, value)
+
+
+class SelectableTextItem(_BoundedItemMixin, QGraphicsTextItem):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._original_color = QColor("#000000")
         self.component_id = str(uuid.uuid4())
 
     def setDefaultTextColor(self, color: QColor):
-        if color != QColor("#EF4444"):
+        if color != _SELECTED_COLOR:
             self._original_color = QColor(color)
             if self.isSelected():
                 return  # save to _original_color but don't visually overwrite red
@@ -32,7 +56,7 @@ class SelectableTextItem(QGraphicsTextItem):
     def itemChange(self, change, value):
         if change == QGraphicsTextItem.ItemSelectedChange:
             if value:
-                self._set_color_while_selected(QColor("#EF4444"))
+                self._set_color_while_selected(_SELECTED_COLOR)
             else:
                 self._set_color_while_selected(self._original_color)
         return super().itemChange(change, value)
@@ -42,12 +66,12 @@ class SelectableTextItem(QGraphicsTextItem):
         if getattr(self, "design_inverse", False):
             painter.save()
             painter.setPen(Qt.NoPen)
-            painter.setBrush(QBrush(QColor("#000000")))
+            painter.setBrush(_INVERSE_BG_BRUSH)
             painter.drawRect(self.boundingRect())
             painter.restore()
             original_color = self.defaultTextColor()
             if not self.isSelected():
-                self.setDefaultTextColor(QColor("#FFFFFF"))
+                self.setDefaultTextColor(_INVERSE_TEXT)
             super().paint(painter, option, widget)
             if not self.isSelected():
                 self.setDefaultTextColor(original_color)
@@ -55,13 +79,13 @@ class SelectableTextItem(QGraphicsTextItem):
             super().paint(painter, option, widget)
 
 
-class SelectableLineItem(QGraphicsLineItem):
+class SelectableLineItem(_BoundedItemMixin, QGraphicsLineItem):
     def paint(self, painter, option, widget=None):
         option.state &= ~QStyle.State_Selected
         if self.isSelected():
             original_pen = self.pen()
             red_pen = QPen(original_pen)
-            red_pen.setColor(QColor("#EF4444"))
+            red_pen.setColor(_SELECTED_COLOR)
             self.setPen(red_pen)
             super().paint(painter, option, widget)
             self.setPen(original_pen)
@@ -69,13 +93,13 @@ class SelectableLineItem(QGraphicsLineItem):
             super().paint(painter, option, widget)
 
 
-class SelectableRectItem(QGraphicsRectItem):
+class SelectableRectItem(_BoundedItemMixin, QGraphicsRectItem):
     def paint(self, painter, option, widget=None):
         option.state &= ~QStyle.State_Selected
         if self.isSelected():
             original_pen = self.pen()
             red_pen = QPen(original_pen)
-            red_pen.setColor(QColor("#EF4444"))
+            red_pen.setColor(_SELECTED_COLOR)
             self.setPen(red_pen)
             super().paint(painter, option, widget)
             self.setPen(original_pen)
@@ -96,17 +120,36 @@ _EAN_PATTERN     = [1, 1, 2, 1, 1, 2, 1, 1, 1, 2, 1, 2, 1, 1, 1, 2, 1, 1, 2, 1,
 _CODE39_PATTERN  = [2, 1, 1, 1, 2, 1, 1, 1, 2, 1, 1, 2, 1, 1, 1, 2, 1, 2, 1, 1,
                     1, 2, 1, 1, 2, 1, 1, 1, 2, 1, 1, 2, 1, 1, 1, 2, 1, 1, 2, 1]
 
+# Paint resources shared by every BarcodeItem (QPen/QBrush are implicitly shared)
+_BG_BRUSH            = QBrush(Qt.white)
+_BAR_BRUSH           = QBrush(Qt.black)
+_BORDER_PEN          = QPen(QColor("#CBD5E1"), 1, Qt.DashLine)
+_BORDER_PEN_SELECTED = QPen(_SELECTED_COLOR, 1, Qt.DashLine)
+
 _2D_DESIGNS  = {"AZTEC (2D)", "DATA MATRIX (2D)", "QR (2D)"}
 _EAN_DESIGNS = {"EAN 13", "EAN 8", "UPC A"}
 _C39_DESIGNS = {"CODE 39", "CODE 93", "CODE 11", "INTERLEAVED 2 OF 5"}
 
 
+# design name → bar pattern; anything not listed uses _LINEAR_PATTERN
+_BAR_PATTERNS = {
+    **{d: _EAN_PATTERN    for d in _EAN_DESIGNS},
+    **{d: _CODE39_PATTERN for d in _C39_DESIGNS},
+}
+
+# Interpretation-line fonts keyed by point size, shared by every BarcodeItem
+_TEXT_FONTS: dict[int, QFont] = {}
+
+
 def _bar_pattern_for(design: str):
-    if design in _EAN_DESIGNS:
-        return _EAN_PATTERN
-    if design in _C39_DESIGNS:
-        return _CODE39_PATTERN
-    return _LINEAR_PATTERN
+    return _BAR_PATTERNS.get(design, _LINEAR_PATTERN)
+
+
+def _text_font(point_size: int) -> QFont:
+    font = _TEXT_FONTS.get(point_size)
+    if font is None:
+        font = _TEXT_FONTS[point_size] = QFont("Courier", point_size, QFont.Bold)
+    return font
 
 
 class BarcodeItem(QGraphicsItem):
@@ -133,6 +176,10 @@ class BarcodeItem(QGraphicsItem):
         self._linear_width     = 95
         self._linear_height    = 40
 
+        # Bar rects for the last (design, size) painted; see _bar_rects()
+        self._bars_key         = None
+        self._bars             = []
+
         self.setTransformOriginPoint(
             self.container_width / 2,
             self.container_height / 2
@@ -144,6 +191,10 @@ class BarcodeItem(QGraphicsItem):
             | QGraphicsItem.ItemSendsGeometryChanges
         )
 
+        # Repaints caused by dragging or by neighbouring items blit the cached
+        # raster; update() (size, design, selection) re-renders it.
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+
     # ── geometry ──────────────────────────────────────────────────────────────
 
     def boundingRect(self) -> QRectF:
@@ -175,6 +226,11 @@ class BarcodeItem(QGraphicsItem):
         delta = scene_pos - current_tl
         self.setPos(self.pos() + delta)
 
+    @staticmethod
+    def is_2d_design(design: str) -> bool:
+        """True for the square matrix designs (AZTEC, QR, DataMatrix)."""
+        return design in _2D_DESIGNS
+
     @staticmethod
     def natural_size_for(design: str, linear_w: float = 95, linear_h: float = 40):
         """
@@ -198,24 +254,22 @@ class BarcodeItem(QGraphicsItem):
         w = self.container_width
         h = self.container_height
         is_2d = self.design in _2D_DESIGNS
+        box = QRectF(0, 0, w, h)
 
         painter.setRenderHint(QPainter.Antialiasing, False)
 
         # ── background ────────────────────────────────────────────────────────
         painter.setPen(Qt.NoPen)
-        painter.setBrush(QBrush(Qt.white))
-        painter.drawRect(QRectF(0, 0, w, h))
+        painter.setBrush(_BG_BRUSH)
+        painter.drawRect(box)
 
         # ── selection border ─────────────────────────────────────────────────
-        if self.isSelected():
-            painter.setPen(QPen(QColor("#EF4444"), 1, Qt.DashLine))
-        else:
-            painter.setPen(QPen(QColor("#CBD5E1"), 1, Qt.DashLine))
+        painter.setPen(_BORDER_PEN_SELECTED if self.isSelected() else _BORDER_PEN)
         painter.setBrush(Qt.NoBrush)
-        painter.drawRect(QRectF(0, 0, w, h))
+        painter.drawRect(box)
 
         painter.setPen(Qt.NoPen)
-        painter.setBrush(QBrush(Qt.black))
+        painter.setBrush(_BAR_BRUSH)
 
         if is_2d:
             self._paint_2d(painter, w, h)
@@ -229,22 +283,14 @@ class BarcodeItem(QGraphicsItem):
         bar_area_w = w - 2 * MARGIN_X
         bar_area_h = h - MARGIN_T - TEXT_H - h * 0.03  # small bottom gap
 
-        pattern = _bar_pattern_for(self.design)
-        total_units = sum(pattern)
-        unit = bar_area_w / total_units
-
-        x = MARGIN_X
-        for i, units in enumerate(pattern):
-            bar_w = units * unit
-            if i % 2 == 0:  # even indices = bars
-                painter.drawRect(QRectF(x, MARGIN_T, bar_w, bar_area_h))
-            x += bar_w
+        painter.drawRects(self._bar_rects(
+            w, h, MARGIN_X, MARGIN_T, bar_area_w, bar_area_h
+        ))
 
         # interpretation text
         if self._show_text:
             painter.setPen(Qt.black)
-            font = QFont("Courier", max(5, int(h * 0.11)), QFont.Bold)
-            painter.setFont(font)
+            painter.setFont(_text_font(max(5, int(h * 0.11))))
             text_y = MARGIN_T + bar_area_h + h * 0.01
             painter.drawText(
                 QRectF(MARGIN_X, text_y, bar_area_w, TEXT_H),
@@ -252,6 +298,30 @@ class BarcodeItem(QGraphicsItem):
                 "*12345*"
             )
 
+    def _bar_rects(self, w, h, margin_x, margin_t, bar_area_w, bar_area_h):
+        """
+        Return the bar rects for the current design and size.
+
+        The pattern is only walked again when the design, size or text
+        setting changes; repaints and selection changes reuse the list.
+        """
+        key = (self.design, w, h, self._show_text)
+        if key != self._bars_key:
+            pattern = _bar_pattern_for(self.design)
+            unit = bar_area_w / sum(pattern)
+
+            bars = []
+            x = margin_x
+            for i, units in enumerate(pattern):
+                bar_w = units * unit
+                if i % 2 == 0:  # even indices = bars
+                    bars.append(QRectF(x, margin_t, bar_w, bar_area_h))
+                x += bar_w
+
+            self._bars_key = key
+            self._bars = bars
+        return self._bars
+
     def _paint_2d(self, painter: QPainter, w: float, h: float):
         MARGIN = min(w, h) * 0.08
         size   = min(w - 2 * MARGIN, h - 2 * MARGIN)
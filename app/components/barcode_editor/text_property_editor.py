@@ -1,5 +1,7 @@
 """TextPropertyEditor — orchestrates all type-specific mixins."""
 
+from functools import partial
+
 from PySide6.QtWidgets import (
     QWidget, QFormLayout, QLabel, QLineEdit, QSizePolicy, QHBoxLayout,
     QFrame, QScrollArea, QVBoxLayout, QPushButton, QTextEdit,
@@ -18,6 +20,7 @@ from components.barcode_editor.system_mixin import SystemMixin
 from components.barcode_editor.merge_konversi_mixin import (
     MergeKonversiMixin, MultiSelectCombo, MergeInputWidget,
 )
+from components.barcode_editor.deferred_update_mixin import DeferredUpdateMixin
 
 LABEL_W = 70
 
@@ -32,13 +35,15 @@ _DISABLED_COMBO_STYLE = """
 """
 
 
+_LABEL_STYLE = (
+    f"color: {COLORS['legacy_blue']}; font-size: 9px; text-transform: uppercase; "
+    "background: transparent; border: none;"
+)
+
+
 def _lbl(text: str) -> QLabel:
-    label_style = (
-        f"color: {COLORS['legacy_blue']}; font-size: 9px; text-transform: uppercase; "
-        "background: transparent; border: none;"
-    )
     l = QLabel(text)
-    l.setStyleSheet(label_style)
+    l.setStyleSheet(_LABEL_STYLE)
     l.setFixedWidth(LABEL_W)
     l.setAlignment(Qt.AlignLeft | Qt.AlignBottom)
     return l
@@ -106,14 +111,14 @@ class InlineChecklistWidget(QWidget):
         self._btn_up.setStyleSheet(_arrow_style)
         self._btn_up.setCursor(Qt.PointingHandCursor)
         self._btn_up.setFocusPolicy(Qt.NoFocus)
-        self._btn_up.clicked.connect(lambda: self._move_focused(-1))
+        self._btn_up.clicked.connect(self._move_focused_up)
 
         self._btn_dn = QPushButton("▼")
         self._btn_dn.setFixedSize(14, 16)
         self._btn_dn.setStyleSheet(_arrow_style)
         self._btn_dn.setCursor(Qt.PointingHandCursor)
         self._btn_dn.setFocusPolicy(Qt.NoFocus)
-        self._btn_dn.clicked.connect(lambda: self._move_focused(+1))
+        self._btn_dn.clicked.connect(self._move_focused_down)
 
         top_lay.addWidget(self._btn_all)
         top_lay.addWidget(self._btn_none)
@@ -308,6 +313,12 @@ class InlineChecklistWidget(QWidget):
         self._focused_name = name
         self._refresh_row_styles()
 
+    def _move_focused_up(self):
+        self._move_focused(-1)
+
+    def _move_focused_down(self):
+        self._move_focused(+1)
+
     def _move_focused(self, direction: int):
         name = self._focused_name
         if not name or name not in self._items:
@@ -358,6 +369,7 @@ class TextPropertyEditor(
     LinkMixin,
     SystemMixin,
     MergeKonversiMixin,
+    DeferredUpdateMixin,
     QWidget,
 ):
     def __init__(self, target_item, update_callback):
@@ -367,6 +379,7 @@ class TextPropertyEditor(
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
 
         self.init_lookup_state()
+        self._init_deferred_updates()
 
         layout = QFormLayout(self)
         layout.setContentsMargins(10, 10, 10, 10)
@@ -455,8 +468,8 @@ class TextPropertyEditor(
         self.top_spin  = make_spin(-5000, 5000, int(round(_init_scene_rect.top())))
         self.left_spin = make_spin(-5000, 5000, int(round(_init_scene_rect.left())))
         self.size_spin.valueChanged.connect(self.apply_font_changes)
-        self.top_spin.valueChanged.connect(lambda v: self._move_to_visual(target_y=v))
-        self.left_spin.valueChanged.connect(lambda v: self._move_to_visual(target_x=v))
+        self.top_spin.valueChanged.connect(self._on_top_changed)
+        self.left_spin.valueChanged.connect(self._on_left_changed)
         layout.addRow(_lbl("FONT SIZE :"), self.size_spin)
         layout.addRow(_lbl("TOP :"),       self.top_spin)
         layout.addRow(_lbl("LEFT :"),      self.left_spin)
@@ -490,9 +503,7 @@ class TextPropertyEditor(
         layout.addRow(_lbl("SYSTEM VALUE :"), self.system_value_combo)
         layout.addRow(_lbl("EXTRA :"),        self.system_extra_combo)
         self.system_value_combo.currentTextChanged.connect(self._on_system_value_changed)
-        self.system_extra_combo.currentTextChanged.connect(
-            lambda v: setattr(self.item, "design_system_extra", v)
-        )
+        self.system_extra_combo.currentTextChanged.connect(partial(setattr, self.item, "design_system_extra"))
         self.restore_system_values(
             getattr(self.item, "design_system_value", ""),
             getattr(self.item, "design_system_extra", ""),
@@ -614,9 +625,7 @@ class TextPropertyEditor(
         self.build_connection_combo()
         self.group_combo.currentTextChanged.connect(self._on_group_changed)
         self.table_combo.currentTextChanged.connect(self._on_table_changed)
-        self.field_edit.selectionChanged.connect(
-            lambda names: setattr(self.item, "design_field", ",".join(names))
-        )
+        self.field_edit.selectionChanged.connect(self._apply_field_selection)
 
         def _on_query_changed():
             v = self.table_extra.toPlainText()
@@ -646,9 +655,7 @@ class TextPropertyEditor(
         self.caption_input.setStyleSheet(MODERN_INPUT_STYLE)
         self.caption_input.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self.caption_input.setText(getattr(self.item, "design_caption", "") or "")
-        self.caption_input.textChanged.connect(
-            lambda v: setattr(self.item, "design_caption", v)
-        )
+        self.caption_input.textChanged.connect(partial(setattr, self.item, "design_caption"))
         layout.addRow(_lbl("CAPTION :"), self.caption_input)
 
         self.wrap_combo      = make_chevron_combo(["NO", "YES"])
@@ -656,17 +663,13 @@ class TextPropertyEditor(
         self.wrap_combo.setCurrentText(
             "YES" if getattr(self.item, "design_wrap_text", False) else "NO"
         )
-        self.wrap_combo.currentTextChanged.connect(
-            lambda v: setattr(self.item, "design_wrap_text", v == "YES")
-        )
+        self.wrap_combo.currentTextChanged.connect(self._apply_wrap_text)
         _ww = getattr(self.item, "design_wrap_width", 1)
         try:
             self.wrap_width_spin.setValue(int(_ww) if _ww else 0)
         except (TypeError, ValueError):
             pass
-        self.wrap_width_spin.valueChanged.connect(
-            lambda v: setattr(self.item, "design_wrap_width", v)
-        )
+        self.wrap_width_spin.valueChanged.connect(partial(setattr, self.item, "design_wrap_width"))
         layout.addRow(_lbl("WRAP TEXT :"),  self.wrap_combo)
         layout.addRow(_lbl("WRAP WIDTH :"), self.wrap_width_spin)
 
@@ -728,27 +731,13 @@ class TextPropertyEditor(
         self._trim_checked = bool(_trim)
         self._set_trim_style(self._trim_checked)
 
-        self.editor_combo.currentTextChanged.connect(
-            lambda v: setattr(self.item, "design_editor", v)
-        )
-        self.data_type_combo.currentTextChanged.connect(
-            lambda v: setattr(self.item, "design_data_type", v)
-        )
-        self.max_length_spin.valueChanged.connect(
-            lambda v: setattr(self.item, "design_max_length", v)
-        )
-        self.save_field_combo.currentTextChanged.connect(
-            lambda v: setattr(self.item, "design_save_field", v)
-        )
-        self.column_spin.valueChanged.connect(
-            lambda v: setattr(self.item, "design_column", v)
-        )
-        self.mandatory_combo.currentTextChanged.connect(
-            lambda v: setattr(self.item, "design_mandatory", v)
-        )
-        self.format_edit.textChanged.connect(
-            lambda v: setattr(self.item, "design_format", v)
-        )
+        self.editor_combo.currentTextChanged.connect(partial(setattr, self.item, "design_editor"))
+        self.data_type_combo.currentTextChanged.connect(partial(setattr, self.item, "design_data_type"))
+        self.max_length_spin.valueChanged.connect(partial(setattr, self.item, "design_max_length"))
+        self.save_field_combo.currentTextChanged.connect(partial(setattr, self.item, "design_save_field"))
+        self.column_spin.valueChanged.connect(partial(setattr, self.item, "design_column"))
+        self.mandatory_combo.currentTextChanged.connect(partial(setattr, self.item, "design_mandatory"))
+        self.format_edit.textChanged.connect(partial(setattr, self.item, "design_format"))
 
         _type_val = getattr(self.item, "design_type", "FIX")
         # Block group_combo signals so _on_type_changed's enable_for_lookup
@@ -1099,13 +1088,33 @@ class TextPropertyEditor(
             self._sync_same_with_targets()
         self.update_callback()
 
+    def _apply_field_selection(self, names: list):
+        self.item.design_field = ",".join(names)
+
+    def _apply_wrap_text(self, value: str):
+        self.item.design_wrap_text = (value == "YES")
+
     def apply_font_changes(self, size: int):
+        self._queue_update(self._apply_font_size)
+
+    def _apply_font_size(self):
         font = self.item.font()
-        font.setPointSize(size)
+        font.setPointSize(self.size_spin.value())
         self.item.setFont(font)
         if SameWithRegistry.is_source(self.item):
             self._sync_same_with_targets()
-        self.update_callback()
+
+    def _on_top_changed(self, value: int):
+        self._queue_update(self._apply_top, notify=False)
+
+    def _on_left_changed(self, value: int):
+        self._queue_update(self._apply_left, notify=False)
+
+    def _apply_top(self):
+        self._move_to_visual(target_y=self.top_spin.value())
+
+    def _apply_left(self):
+        self._move_to_visual(target_x=self.left_spin.value())
 
     def _move_visual_tl(self, want_x: int, want_y: int):
         self._move_to_visual(target_x=want_x, target_y=want_y)
@@ -1119,10 +1128,10 @@ class TextPropertyEditor(
 
     def _move_to_visual(self, target_x=None, target_y=None):
         off_x, off_y = self._get_rotation_offset()
-        if target_x is not None:
-            self.item.setX(target_x - off_x)
-        if target_y is not None:
-            self.item.setY(target_y - off_y)
+        pos = self.item.pos()
+        new_x = pos.x() if target_x is None else target_x - off_x
+        new_y = pos.y() if target_y is None else target_y - off_y
+        self.item.setPos(new_x, new_y)
         self.update_position_fields(self.item.pos())
 
     def update_position_fields(self, pos):
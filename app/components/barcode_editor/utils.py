@@ -1,6 +1,5 @@
 """Shared utilities, styles, and small widgets for the barcode editor."""
 
-import qtawesome as qta
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame,
     QApplication, QScrollArea, QSizePolicy, QPushButton,
@@ -9,6 +8,8 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt, QPointF, QRectF, QRect, QSize, QEvent, Signal
 from PySide6.QtGui import QColor, QPen, QBrush, QPainter, QFont, QFontMetrics, QCursor
 
+from components.icons import icon_pixmap
+
 # ── Colour palette ────────────────────────────────────────────────────────────
 
 COLORS = {
@@ -126,31 +127,27 @@ _LINE_DISABLED = """
 # ── Canvas helpers ────────────────────────────────────────────────────────────
 
 def keep_within_bounds(item, new_pos):
-    scene_rect = item.scene().sceneRect()
-    aabb = item.mapToScene(item.boundingRect()).boundingRect()
-    off_x = aabb.left() - item.pos().x()
-    off_y = aabb.top()  - item.pos().y()
+    # Called for every ItemPositionChange while dragging, so each Qt getter
+    # is read once into a local.
+    sr   = item.scene().sceneRect()
+    aabb = item.sceneBoundingRect()
+    pos  = item.pos()
+    off_x = aabb.left() - pos.x()
+    off_y = aabb.top()  - pos.y()
     new_aabb_x = new_pos.x() + off_x
     new_aabb_y = new_pos.y() + off_y
-    clamped_x = max(scene_rect.left(),
-                    min(new_aabb_x, scene_rect.right()  - aabb.width()))
-    clamped_y = max(scene_rect.top(),
-                    min(new_aabb_y, scene_rect.bottom() - aabb.height()))
+    clamped_x = max(sr.left(), min(new_aabb_x, sr.right()  - aabb.width()))
+    clamped_y = max(sr.top(),  min(new_aabb_y, sr.bottom() - aabb.height()))
     return QPointF(clamped_x - off_x, clamped_y - off_y)
 
 
 def setup_item_logic(item, on_move_callback):
-    from PySide6.QtWidgets import QGraphicsItem
-    original_item_change = item.itemChange
-
-    def patched_item_change(change, value):
-        if change == QGraphicsItem.ItemPositionChange and item.scene():
-            new_pos = keep_within_bounds(item, value)
-            on_move_callback(new_pos)
-            return new_pos
-        return original_item_change(change, value)
-
-    item.itemChange = patched_item_change
+    """
+    Keep *item* inside the scene rect while it moves and report each new
+    position to *on_move_callback*.  The clamping itself is done by the
+    Selectable* item classes' itemChange.
+    """
+    item._on_move = on_move_callback
 
 
 # ── CheckmarkCheckBox ─────────────────────────────────────────────────────────
@@ -384,8 +381,8 @@ class CustomCombo(QFrame):
 
     def _set_chevron(self, open_):
         self._chevron.setPixmap(
-            qta.icon("fa5s.chevron-up" if open_ else "fa5s.chevron-down",
-                     color="#3B82F6" if open_ else "#71717A").pixmap(10, 10)
+            icon_pixmap("fa5s.chevron-up" if open_ else "fa5s.chevron-down",
+                        "#3B82F6" if open_ else "#71717A", 10, 10)
         )
 
     def setEnabled(self, enabled):
@@ -525,8 +522,8 @@ class ChevronSpinBox(QSpinBox):
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._px_up   = qta.icon("fa5s.chevron-up",  color="#64748B").pixmap(7, 7)
-        self._px_down = qta.icon("fa5s.chevron-down", color="#64748B").pixmap(7, 7)
+        self._px_up   = icon_pixmap("fa5s.chevron-up",  "#64748B", 7, 7)
+        self._px_down = icon_pixmap("fa5s.chevron-down", "#64748B", 7, 7)
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
 
     def paintEvent(self, event):
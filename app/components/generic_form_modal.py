@@ -9,7 +9,7 @@ from PySide6.QtWidgets import (
     QDialog, QWidget, QVBoxLayout, QHBoxLayout, QFormLayout,
     QLabel, QLineEdit, QComboBox, QDialogButtonBox,
     QScrollArea, QFrame, QPushButton, QSizePolicy, QMessageBox,
-    QGraphicsOpacityEffect, QCheckBox, QTextEdit,
+    QGraphicsOpacityEffect, QCheckBox, QPlainTextEdit,
 )
 from PySide6.QtCore import (
     Qt, Signal, QPropertyAnimation, QEasingCurve, QPoint,
@@ -844,7 +844,7 @@ class GenericFormModal(QDialog):
         widget = self.inputs.get(name)
         if widget is None:
             return ""
-        if isinstance(widget, QTextEdit):
+        if isinstance(widget, QPlainTextEdit):
             return widget.toPlainText().strip()
         if isinstance(widget, QLineEdit):
             return widget.text().strip()
@@ -860,7 +860,7 @@ class GenericFormModal(QDialog):
         widget = self.inputs.get(name)
         if widget is None:
             return
-        if isinstance(widget, QTextEdit):
+        if isinstance(widget, QPlainTextEdit):
             widget.setPlainText(value)
         elif isinstance(widget, QLineEdit):
             widget.setText(value)
@@ -874,11 +874,11 @@ class GenericFormModal(QDialog):
         if widget is None:
             return
 
-        if isinstance(widget, QTextEdit):
+        if isinstance(widget, QPlainTextEdit):
             widget.setReadOnly(disabled)
             if disabled:
                 widget.setStyleSheet(f"""
-                    QTextEdit {{
+                    QPlainTextEdit {{
                         padding: 8px 12px;
                         border: 1px solid {COLORS['border_light']};
                         border-radius: 6px;
@@ -889,7 +889,7 @@ class GenericFormModal(QDialog):
                 """)
             else:
                 widget.setStyleSheet(f"""
-                    QTextEdit {{
+                    QPlainTextEdit {{
                         padding: 8px 12px;
                         border: 1px solid {COLORS['border']};
                         border-radius: 6px;
@@ -897,7 +897,7 @@ class GenericFormModal(QDialog):
                         color: {COLORS['text_primary']};
                         font-size: 13px;
                     }}
-                    QTextEdit:focus {{ border-color: {COLORS['link']}; }}
+                    QPlainTextEdit:focus {{ border-color: {COLORS['link']}; }}
                 """)
         elif isinstance(widget, QLineEdit):
             widget.setReadOnly(disabled)
@@ -1225,7 +1225,7 @@ class GenericFormModal(QDialog):
             return w
 
         elif field_type == "textarea":
-            w = QTextEdit()
+            w = QPlainTextEdit()
             height = field.get("height", 120)
             w.setFixedHeight(height)
             max_length = field.get("max_length")
@@ -1244,17 +1244,17 @@ class GenericFormModal(QDialog):
                     w.textChanged.connect(_limit_text)
                 w.setPlaceholderText(field.get("placeholder", ""))
                 w.setStyleSheet(f"""
-                    QTextEdit {{
+                    QPlainTextEdit {{
                         padding: 8px 12px; border: 1px solid {COLORS['border']};
                         border-radius: 6px; background-color: {COLORS['white']};
                         color: {COLORS['text_primary']}; font-size: 13px;
                     }}
-                    QTextEdit:focus {{ border-color: {COLORS['link']}; }}
+                    QPlainTextEdit:focus {{ border-color: {COLORS['link']}; }}
                 """)
             else:
                 w.setReadOnly(True)
                 w.setStyleSheet(f"""
-                    QTextEdit {{
+                    QPlainTextEdit {{
                         padding: 8px 12px; border: 1px solid {COLORS['border_light']};
                         border-radius: 6px; background-color: {COLORS['readonly_bg']};
                         color: {COLORS['text_primary']}; font-size: 13px;
@@ -1647,7 +1647,7 @@ class GenericFormModal(QDialog):
             if value is None:
                 continue
 
-            if isinstance(widget, QTextEdit):
+            if isinstance(widget, QPlainTextEdit):
                 widget.setPlainText(str(value))
             elif isinstance(widget, QLineEdit):
                 widget.setText(str(value))
@@ -1709,13 +1709,13 @@ class GenericFormModal(QDialog):
                         errors.append(f"{label} (PX): must be a positive whole number")
                         widget._set_error(widget.px_input, widget.px_err, "Must be a positive whole number")
 
-            elif isinstance(widget, QTextEdit):
+            elif isinstance(widget, QPlainTextEdit):
                 if widget.isReadOnly():
                     continue
                 if is_required and not widget.toPlainText().strip():
                     errors.append(f"{label} is required")
                     widget.setStyleSheet(f"""
-                        QTextEdit {{
+                        QPlainTextEdit {{
                             padding: 8px 12px; border: 1.5px solid #EF4444;
                             border-radius: 6px; background-color: #FEF2F2;
                             color: {COLORS['text_primary']}; font-size: 13px;
@@ -1723,7 +1723,7 @@ class GenericFormModal(QDialog):
                     """)
                 else:
                     widget.setStyleSheet(f"""
-                        QTextEdit {{
+                        QPlainTextEdit {{
                             padding: 8px 12px; border: 1px solid {COLORS['border']};
                             border-radius: 6px; background-color: {COLORS['white']};
                             color: {COLORS['text_primary']}; font-size: 13px;
@@ -1764,7 +1764,7 @@ class GenericFormModal(QDialog):
             if getattr(widget, "_field_type", None) == "dimension_pair":
                 data[f"{name}_in"] = widget.inch_input.text().strip()
                 data[f"{name}_px"] = widget.px_input.text().strip()
-            elif isinstance(widget, QTextEdit):
+            elif isinstance(widget, QPlainTextEdit):
                 data[name] = widget.toPlainText().strip()
             elif isinstance(widget, QLineEdit):
                 data[name] = widget.text().strip()
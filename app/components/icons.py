@@ -0,0 +1,24 @@
+"""qtawesome icons and glyph pixmaps shared across the app."""
+
+import qtawesome as qta
+from PySide6.QtGui import QIcon, QPixmap, QPixmapCache
+
+_ICON_CACHE: dict[tuple[str, str], QIcon] = {}
+
+
+def icon(name: str, color: str) -> QIcon:
+    key = (name, color)
+    cached = _ICON_CACHE.get(key)
+    if cached is None:
+        cached = _ICON_CACHE[key] = qta.icon(name, color=color)
+    return cached
+
+
+def icon_pixmap(name: str, color: str, w: int, h: int) -> QPixmap:
+    """qtawesome glyph rendered once per (name, color, w, h) via QPixmapCache."""
+    key = f"icon|{name}|{color}|{w}x{h}"
+    pm = QPixmapCache.find(key)
+    if pm is None:
+        pm = icon(name, color).pixmap(w, h)
+        QPixmapCache.insert(key, pm)
+    return pm
@@ -1,11 +1,11 @@
-import qtawesome as qta
 from PySide6.QtWidgets import (
     QHBoxLayout, QVBoxLayout, QLabel,
     QLineEdit, QFrame, QPushButton,
-    QGraphicsOpacityEffect, QScrollArea, QWidget,
+    QScrollArea, QWidget,
 )
 from PySide6.QtCore import Qt, Signal, QPropertyAnimation, QEasingCurve, QPoint
-from PySide6.QtCore import QEvent
+
+from components.icons import icon as _icon
 
 # Animation
 FILTER_PANEL_ANIM_DURATION = 200
@@ -24,6 +24,114 @@ _TEXT_MUTED = "#71717A"
 _ACCENT = "#3B82F6"
 _ACCENT_BG = "#EFF6FF"
 
+# One stylesheet on the StandardSearchBar root styles the whole component:
+# the trigger, the popup panel (parented to the bar) and its option buttons.
+# Qt parses it once per search bar instead of once per child widget.
+_SEARCHBAR_QSS = f"""
+    #SearchBarCard {{
+        background: {_BG};
+        border-radius: 8px;
+        border: 1px solid {_BORDER};
+    }}
+    QLabel#HeaderLabel {{
+        font-size: 11px;
+        color: {_TEXT_MUTED};
+        background: transparent;
+        border: none;
+    }}
+    QLineEdit {{
+        border: 1px solid {_BORDER};
+        border-radius: 6px;
+        padding: 6px 10px;
+        background: {_BG};
+        color: {_TEXT};
+        font-size: 13px;
+    }}
+    QLineEdit:focus {{
+        border-color: {_ACCENT};
+    }}
+
+    FilterTriggerButton {{
+        background: {_BG};
+        border: 1px solid {_BORDER};
+        border-radius: 6px;
+    }}
+    FilterTriggerButton:hover {{
+        border-color: #D4D4D8;
+    }}
+    FilterTriggerButton QLabel {{
+        color: {_TEXT};
+        font-size: 12px;
+        background: transparent;
+        border: none;
+    }}
+
+    AnimatedFilterPanel {{
+        background: {_BG};
+        border: 1px solid {_BORDER};
+        border-radius: 6px;
+    }}
+    AnimatedFilterPanel QScrollArea {{
+        background: transparent;
+        border: none;
+    }}
+    AnimatedFilterPanel QScrollBar:vertical {{
+        background: transparent;
+        width: 6px;
+        margin: 4px 2px 4px 0px;
+        border-radius: 3px;
+    }}
+    AnimatedFilterPanel QScrollBar::handle:vertical {{
+        background: #D1D5DB;
+        min-height: 24px;
+        border-radius: 3px;
+    }}
+    AnimatedFilterPanel QScrollBar::handle:vertical:hover {{
+        background: #9CA3AF;
+    }}
+    AnimatedFilterPanel QScrollBar::add-line:vertical,
+    AnimatedFilterPanel QScrollBar::sub-line:vertical {{
+        height: 0;
+        background: none;
+    }}
+    AnimatedFilterPanel QScrollBar::add-page:vertical,
+    AnimatedFilterPanel QScrollBar::sub-page:vertical {{
+        background: none;
+    }}
+    QWidget#FilterOptionList {{
+        background: transparent;
+    }}
+    QWidget#FilterOptionList QPushButton {{
+        background: transparent;
+        color: {_TEXT};
+        border: none;
+        border-radius: 4px;
+        font-size: 12px;
+        text-align: left;
+        padding: 0 10px;
+    }}
+    QWidget#FilterOptionList QPushButton:hover {{
+        background: {_BG_SUBTLE};
+    }}
+    QWidget#FilterOptionList QPushButton[selected="true"] {{
+        background: {_ACCENT_BG};
+        color: {_ACCENT};
+    }}
+    QWidget#FilterOptionList QPushButton[selected="true"]:hover {{
+        background: #DBEAFE;
+    }}
+"""
+
+# Icons used by the search bar; warmed into the shared cache by preload_icons()
+_PRELOAD_ICONS = ("fa5s.chevron-up", "fa5s.chevron-down", "fa5s.search", "fa5s.times-circle")
+
+
+def preload_icons():
+    """Warm the shared icon cache so the qtawesome font load happens off the first search bar."""
+    for name in _PRELOAD_ICONS:
+        for color in (_TEXT_MUTED, _TEXT):
+            _icon(name, color)
+
 
 class FilterTriggerButton(QFrame):
     """Clickable filter trigger showing current selection and chevron."""
@@ -40,28 +148,14 @@ class FilterTriggerButton(QFrame):
     def _build_ui(self):
         self.setFixedHeight(36)
         self.setFixedWidth(DROPDOWN_WIDTH)
-        self.setStyleSheet(f"""
-            FilterTriggerButton {{
-                background: {_BG};
-                border: 1px solid {_BORDER};
-                border-radius: 6px;
-            }}
-            FilterTriggerButton:hover {{
-                border-color: #D4D4D8;
-            }}
-        """)
         layout = QHBoxLayout(self)
         layout.setContentsMargins(10, 0, 8, 0)
         layout.setSpacing(6)
 
         self._current_lbl = QLabel(self._current)
-        self._current_lbl.setStyleSheet(
-            f"color: {_TEXT}; font-size: 12px; background: transparent; border: none;"
-        )
         self._current_lbl.setMinimumWidth(1)
         self._chevron_lbl = QLabel()
         self._chevron_lbl.setAttribute(Qt.WA_TransparentForMouseEvents)
-        self._chevron_lbl.setStyleSheet("background: transparent; border: none;")
         self._update_chevron()
 
         layout.addWidget(self._current_lbl, 1)
@@ -69,7 +163,7 @@ class FilterTriggerButton(QFrame):
 
     def _update_chevron(self):
         icon = "fa5s.chevron-up" if self._is_open else "fa5s.chevron-down"
-        self._chevron_lbl.setPixmap(qta.icon(icon, color=_TEXT_MUTED).pixmap(10, 10))
+        self._chevron_lbl.setPixmap(_icon(icon, _TEXT_MUTED).pixmap(10, 10))
 
     def set_current(self, text: str):
         self._current = text
@@ -89,26 +183,20 @@ class AnimatedFilterPanel(QFrame):
     """Panel that slides down to show filter options, scrollable when overflowing."""
 
     optionSelected = Signal(str)
+    closed = Signal()
 
     def __init__(self, options: list[str], selected: str, parent=None):
         super().__init__(parent)
+        # Native popup: Qt closes it on outside clicks and window deactivation
+        self.setWindowFlags(Qt.Popup)
         self._options = options
         self._selected = selected
+        self._anchor = None
         self._height_anim = None
         self._opacity_anim = None
-        self._opacity_effect = QGraphicsOpacityEffect(self)
-        self.setGraphicsEffect(self._opacity_effect)
-        self._opacity_effect.setOpacity(0.0)
         self.setMaximumHeight(0)
         self.setMinimumHeight(0)
         self.setFixedWidth(DROPDOWN_WIDTH)
-        self.setStyleSheet(f"""
-            AnimatedFilterPanel {{
-                background: {_BG};
-                border: 1px solid {_BORDER};
-                border-radius: 6px;
-            }}
-        """)
         self._build_options()
 
     def get_target_height(self) -> int:
@@ -132,39 +220,10 @@ class AnimatedFilterPanel(QFrame):
         self._scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self._scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         self._scroll.setFrameShape(QFrame.NoFrame)
-        self._scroll.setStyleSheet("""
-            QScrollArea {
-                background: transparent;
-                border: none;
-            }
-            QScrollBar:vertical {
-                background: transparent;
-                width: 6px;
-                margin: 4px 2px 4px 0px;
-                border-radius: 3px;
-            }
-            QScrollBar::handle:vertical {
-                background: #D1D5DB;
-                min-height: 24px;
-                border-radius: 3px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: #9CA3AF;
-            }
-            QScrollBar::add-line:vertical,
-            QScrollBar::sub-line:vertical {
-                height: 0;
-                background: none;
-            }
-            QScrollBar::add-page:vertical,
-            QScrollBar::sub-page:vertical {
-                background: none;
-            }
-        """)
 
         # Container widget inside scroll area
         container = QWidget()
-        container.setStyleSheet("background: transparent;")
+        container.setObjectName("FilterOptionList")
         inner_layout = QVBoxLayout(container)
         inner_layout.setContentsMargins(6, 6, 6, 6)
         inner_layout.setSpacing(2)
@@ -183,36 +242,12 @@ class AnimatedFilterPanel(QFrame):
         outer_layout.addWidget(self._scroll)
 
     def _style_button(self, btn: QPushButton, selected: bool):
-        if selected:
-            btn.setStyleSheet(f"""
-                QPushButton {{
-                    background: {_ACCENT_BG};
-                    color: {_ACCENT};
-                    border: none;
-                    border-radius: 4px;
-                    font-size: 12px;
-                    text-align: left;
-                    padding: 0 10px;
-                }}
-                QPushButton:hover {{
-                    background: #DBEAFE;
-                }}
-            """)
-        else:
-            btn.setStyleSheet(f"""
-                QPushButton {{
-                    background: transparent;
-                    color: {_TEXT};
-                    border: none;
-                    border-radius: 4px;
-                    font-size: 12px;
-                    text-align: left;
-                    padding: 0 10px;
-                }}
-                QPushButton:hover {{
-                    background: {_BG_SUBTLE};
-                }}
-            """)
+        if btn.property("selected") == selected:
+            return
+        btn.setProperty("selected", selected)
+        # Re-evaluate the [selected="true"] rule from the search bar stylesheet
+        btn.style().unpolish(btn)
+        btn.style().polish(btn)
 
     def _on_option_clicked(self, option: str):
         self._selected = option
@@ -220,13 +255,35 @@ class AnimatedFilterPanel(QFrame):
             self._style_button(btn, btn.text() == option)
         self.optionSelected.emit(option)
 
+    def mousePressEvent(self, event):
+        # A click on the anchor (the trigger) closes the popup; don't let Qt
+        # replay it onto the trigger, which would immediately reopen it.
+        if self._anchor is not None and not self.rect().contains(event.position().toPoint()):
+            anchor_pos = self._anchor.mapFromGlobal(event.globalPosition().toPoint())
+            self.setAttribute(Qt.WA_NoMouseReplay, self._anchor.rect().contains(anchor_pos))
+        super().mousePressEvent(event)
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.closed.emit()
+
     # ── Animation ──────────────────────────────────────────────────────────
 
+    def popup_below(self, anchor: QWidget):
+        """Open as a popup aligned to the bottom-left corner of *anchor*."""
+        self._anchor = anchor
+        pos = anchor.mapToGlobal(QPoint(0, anchor.height()))
+        self.setWindowOpacity(1.0)
+        self.setMaximumHeight(self.get_target_height())
+        self.setGeometry(pos.x(), pos.y(), DROPDOWN_WIDTH, 1)
+        self.show()
+        self.raise_()
+        self.show_animated()
+
     def show_animated(self):
         target_h = self.get_target_height()
         self.setMinimumHeight(0)
         self.setMaximumHeight(target_h)
-        self._opacity_effect.setOpacity(1.0)
 
         self._height_anim = QPropertyAnimation(self, b"minimumHeight")
         self._height_anim.setDuration(FILTER_PANEL_ANIM_DURATION)
@@ -244,7 +301,9 @@ class AnimatedFilterPanel(QFrame):
         self._height_anim.setEndValue(0)
         self._height_anim.setEasingCurve(QEasingCurve.InCubic)
 
-        self._opacity_anim = QPropertyAnimation(self._opacity_effect, b"opacity")
+        # The panel is a top-level popup, so fade the window itself rather
+        # than compositing through a QGraphicsOpacityEffect.
+        self._opacity_anim = QPropertyAnimation(self, b"windowOpacity")
         self._opacity_anim.setDuration(FILTER_PANEL_ANIM_DURATION)
         self._opacity_anim.setStartValue(1.0)
         self._opacity_anim.setEndValue(0.0)
@@ -258,6 +317,7 @@ class AnimatedFilterPanel(QFrame):
         self._height_anim.finished.disconnect(self._on_hide_finished)
         self.setMaximumHeight(0)
         self.hide()
+        self.setWindowOpacity(1.0)
 
     def set_selected(self, option: str):
         self._selected = option
@@ -268,9 +328,13 @@ class AnimatedFilterPanel(QFrame):
 class StandardSearchBar(QFrame):
     searchChanged = Signal(str, str)
 
+    _icons_preloaded = False
+
     def __init__(self, filter_options=None, table_headers=None):
-        self._just_opened = False
         super().__init__()
+        if not StandardSearchBar._icons_preloaded:
+            preload_icons()
+            StandardSearchBar._icons_preloaded = True
         self.setObjectName("SearchBarCard")
 
         # Use table_headers if provided, otherwise fall back to filter_options
@@ -303,39 +367,14 @@ class StandardSearchBar(QFrame):
                     self._filter_options = headers
                     self._current_filter = self._filter_options[0]
                     self._filter_trigger.set_current(self._current_filter)
-                    self._filter_panel.deleteLater()
-                    self._filter_panel = AnimatedFilterPanel(
-                        self._filter_options, self._current_filter, self
-                    )
-                    self._filter_panel.optionSelected.connect(self._on_filter_option_selected)
-                    self._filter_panel.hide()
+                    # Drop any stale panel; the next open builds one with the new headers
+                    if self._filter_panel is not None:
+                        self._filter_panel.deleteLater()
+                        self._filter_panel = None
                     break
 
     def _setup_style(self):
-        self.setStyleSheet(f"""
-            #SearchBarCard {{
-                background: {_BG};
-                border-radius: 8px;
-                border: 1px solid {_BORDER};
-            }}
-            QLabel#HeaderLabel {{
-                font-size: 11px;
-                color: {_TEXT_MUTED};
-                background: transparent;
-                border: none;
-            }}
-            QLineEdit {{
-                border: 1px solid {_BORDER};
-                border-radius: 6px;
-                padding: 6px 10px;
-                background: {_BG};
-                color: {_TEXT};
-                font-size: 13px;
-            }}
-            QLineEdit:focus {{
-                border-color: {_ACCENT};
-            }}
-        """)
+        self.setStyleSheet(_SEARCHBAR_QSS)
 
     def _init_ui(self):
         main_layout = QVBoxLayout(self)
@@ -363,11 +402,11 @@ class StandardSearchBar(QFrame):
         self.search_input.setPlaceholderText("Type to filter...")
         self.search_input.setMinimumHeight(36)
         self.search_input.addAction(
-            qta.icon("fa5s.search", color=_TEXT_MUTED),
+            _icon("fa5s.search", _TEXT_MUTED),
             QLineEdit.LeadingPosition
         )
         self.clear_action = self.search_input.addAction(
-            qta.icon("fa5s.times-circle", color=_TEXT_MUTED),
+            _icon("fa5s.times-circle", _TEXT_MUTED),
             QLineEdit.TrailingPosition
         )
         self.clear_action.setVisible(False)
@@ -378,56 +417,39 @@ class StandardSearchBar(QFrame):
 
         main_layout.addLayout(top_row)
 
-        self._filter_panel = AnimatedFilterPanel(
-            self._filter_options, self._current_filter, self
-        )
-        self._filter_panel.optionSelected.connect(self._on_filter_option_selected)
-        self._filter_panel.hide()
+        # Built on first open; most users never touch the filter dropdown
+        self._filter_panel = None
 
         self.search_input.textChanged.connect(self._on_text_changed)
 
-    def _toggle_filter_panel(self):
-        win = self.window()
-        if not win:
-            return
+    def _ensure_panel(self):
+        if self._filter_panel is None:
+            self._filter_panel = AnimatedFilterPanel(
+                self._filter_options, self._current_filter, self
+            )
+            self._filter_panel.optionSelected.connect(self._on_filter_option_selected)
+            self._filter_panel.closed.connect(self._on_filter_panel_closed)
+            self._filter_panel.hide()
+        return self._filter_panel
 
-        # OPEN DROPDOWN
+    def _toggle_filter_panel(self):
+        self._ensure_panel()
         if not self._filter_panel.isVisible():
-            pt_global = self._filter_trigger.mapToGlobal(
-                QPoint(0, self._filter_trigger.height())
-            )
-            pos_in_window = win.mapFromGlobal(pt_global)
-            target_h = self._filter_panel.get_target_height()
-
-            self._filter_panel.setParent(win)
-            self._filter_panel.setGeometry(
-                pos_in_window.x(),
-                pos_in_window.y(),
-                DROPDOWN_WIDTH,
-                target_h,
-            )
-            self._filter_panel.show()
-            self._filter_panel.raise_()
             self._filter_trigger.set_open(True)
-
-            self._just_opened = True
-            win.installEventFilter(self)
-            self._filter_panel.show_animated()
-
-        # CLOSE DROPDOWN
+            self._filter_panel.popup_below(self._filter_trigger)
         else:
-            self._filter_trigger.set_open(False)
             self._filter_panel.hide_animated()
-            win.removeEventFilter(self)
 
     def _on_filter_option_selected(self, option: str):
         self._current_filter = option
         self._filter_trigger.set_current(option)
         self._filter_panel.set_selected(option)
-        self._filter_trigger.set_open(False)
         self._filter_panel.hide_animated()
         self._emit_search()
 
+    def _on_filter_panel_closed(self):
+        self._filter_trigger.set_open(False)
+
     def _on_text_changed(self, text):
         self.clear_action.setVisible(bool(text))
         self._emit_search()
@@ -449,37 +471,3 @@ class StandardSearchBar(QFrame):
             def currentText(self):
                 return self._bar._current_filter
         return _FilterComboCompat(self)
-
-    def eventFilter(self, obj, event):
-        if self._just_opened:
-            self._just_opened = False
-            return False
-
-        if not self._filter_panel.isVisible():
-            return super().eventFilter(obj, event)
-
-        if not self.isVisible():
-            self._close_filter_panel()
-            return False
-
-        if event.type() in (QEvent.WindowDeactivate, QEvent.FocusOut):
-            self._close_filter_panel()
-            return False
-
-        if event.type() == QEvent.MouseButtonPress:
-            pos = event.globalPosition().toPoint()
-            if not self._filter_panel.geometry().contains(pos) and \
-               not self._filter_trigger.geometry().contains(
-                   self._filter_trigger.mapFromGlobal(pos)
-               ):
-                self._close_filter_panel()
-
-        return super().eventFilter(obj, event)
-
-    def _close_filter_panel(self):
-        if self._filter_panel.isVisible():
-            self._filter_trigger.set_open(False)
-            self._filter_panel.hide_animated()
-            win = self.window()
-            if win:
-                win.removeEventFilter(self)
\ No newline at end of file
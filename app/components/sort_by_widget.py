@@ -3,11 +3,119 @@ from PySide6.QtWidgets import (
     QLineEdit, QListWidget, QListWidgetItem, QFrame,
     QVBoxLayout, QAbstractItemView
 )
-from PySide6.QtCore import Qt, Signal, QEvent
+from PySide6.QtCore import Qt, Signal, Slot, QEvent
 from PySide6.QtGui import QPixmap, QPainter, QPen
 from PySide6.QtGui import QPixmap, QPainter, QPen, QIcon
 from PySide6.QtWidgets import QSizePolicy
 
+# Stylesheets shared by every SortByWidget instance
+_SORT_LABEL_QSS = """
+    QLabel {
+        color:#475569;
+        font-size:12px;
+        font-weight:500;
+    }
+"""
+
+_SORT_INPUT_QSS = """
+    QFrame {
+        background:#FFFFFF;
+        border:1px solid #E2E8F0;
+        border-radius:8px;
+    }
+    QFrame:hover {
+        border:1px solid #CBD5E1;
+    }
+"""
+
+_SORT_DROPDOWN_QSS = """
+    QFrame {
+        background:#FFFFFF;
+        border:1px solid #E2E8F0;
+        border-radius:10px;
+    }
+
+    QListWidget {
+        border:none;
+        background:transparent;
+        font-size:12px;
+        outline:none;
+    }
+
+    QListWidget::item {
+        padding:6px 8px;
+        border-radius:6px;
+        color:#0F172A;
+    }
+
+    QListWidget::item:hover {
+        background:#F1F5F9;
+    }
+
+    QListWidget::item:selected {
+        background:#EAF2FF;
+        color:#0F172A;
+    }
+
+    /* Modern Scrollbar */
+    QScrollBar:vertical {
+        background: transparent;
+        width: 8px;
+        margin: 2px 0 2px 0;
+        border-radius: 4px;
+    }
+
+    QScrollBar::handle:vertical {
+        background: #CBD5E1;
+        min-height: 20px;
+        border-radius: 4px;
+    }
+
+    QScrollBar::handle:vertical:hover {
+        background: #94A3B8;
+    }
+
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+        height: 0;
+        background: none;
+    }
+
+    QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
+        background: none;
+    }
+"""
+
+_CLEAR_BTN_QSS = """
+    QPushButton {
+        background:#F8FAFC;
+        border:1px solid #E2E8F0;
+        border-radius:8px;
+        padding:4px 10px;
+        font-size:12px;
+        color:#475569;
+    }
+    QPushButton:hover {
+        background:#F1F5F9;
+        border:1px solid #CBD5E1;
+    }
+"""
+
+_TAG_QSS = """
+    QPushButton {
+        background:#EAF2FF;
+        color:#1E40AF;
+        padding:2px 8px;
+        border-radius:6px;
+        font-size:11px;
+        font-weight:500;
+        border:none;
+    }
+    QPushButton:hover {
+        background:#DBEAFE;
+    }
+"""
+
+
 class SortByWidget(QWidget):
 
     sortChanged = Signal(list, object)
@@ -17,10 +125,16 @@ class SortByWidget(QWidget):
 
         self._table = table
         self._fields = self._extract_headers()
+        # Lowercased copy of the headers so filtering doesn't re-lower per keystroke
+        self._lower_fields = [f.lower() for f in self._fields]
         self._selected_fields = []
         self._updating_text = False
         # Track direction for each field independently
         self._field_directions = {}  # {field_name: "asc" or "desc"}
+        # Live tag buttons keyed by field name, reused across selection changes
+        self._tag_widgets: dict[str, QPushButton] = {}
+        # Detached tag buttons kept for reuse instead of being deleted
+        self._tag_pool: list[QPushButton] = []
 
         # -------------------------------------------------
         # Layout
@@ -30,13 +144,7 @@ class SortByWidget(QWidget):
         layout.setSpacing(8)
 
         label = QLabel("Sort by")
-        label.setStyleSheet("""
-            QLabel {
-                color:#475569;
-                font-size:12px;
-                font-weight:500;
-            }
-        """)
+        label.setStyleSheet(_SORT_LABEL_QSS)
 
         # -------------------------------------------------
         # Input
@@ -45,16 +153,7 @@ class SortByWidget(QWidget):
         self._input.setMinimumWidth(240)
         self._input.setFixedHeight(28)
         self._input.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        self._input.setStyleSheet("""
-            QFrame {
-                background:#FFFFFF;
-                border:1px solid #E2E8F0;
-                border-radius:8px;
-            }
-            QFrame:hover {
-                border:1px solid #CBD5E1;
-            }
-        """)
+        self._input.setStyleSheet(_SORT_INPUT_QSS)
 
         self._tag_layout = QHBoxLayout(self._input)
         self._tag_layout.setContentsMargins(6, 4, 6, 4)
@@ -68,62 +167,7 @@ class SortByWidget(QWidget):
         # -------------------------------------------------
         self._dropdown = QFrame(None)
         self._dropdown.setWindowFlags(Qt.Popup)
-        self._dropdown.setStyleSheet("""
-            QFrame {
-                background:#FFFFFF;
-                border:1px solid #E2E8F0;
-                border-radius:10px;
-            }
-
-            QListWidget {
-                border:none;
-                background:transparent;
-                font-size:12px;
-                outline:none;
-            }
-
-            QListWidget::item {
-                padding:6px 8px;
-                border-radius:6px;
-                color:#0F172A;
-            }
-
-            QListWidget::item:hover {
-                background:#F1F5F9;
-            }
-
-            QListWidget::item:selected {
-                background:#EAF2FF;
-                color:#0F172A;
-            }
-
-            /* Modern Scrollbar */
-            QScrollBar:vertical {
-                background: transparent;
-                width: 8px;
-                margin: 2px 0 2px 0;
-                border-radius: 4px;
-            }
-
-            QScrollBar::handle:vertical {
-                background: #CBD5E1;
-                min-height: 20px;
-                border-radius: 4px;
-            }
-
-            QScrollBar::handle:vertical:hover {
-                background: #94A3B8;
-            }
-
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0;
-                background: none;
-            }
-
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
-                background: none;
-            }
-        """)
+        self._dropdown.setStyleSheet(_SORT_DROPDOWN_QSS)
 
         drop_layout = QVBoxLayout(self._dropdown)
         drop_layout.setContentsMargins(6, 6, 6, 6)
@@ -147,20 +191,7 @@ class SortByWidget(QWidget):
         # -------------------------------------------------
         clear_btn = QPushButton("Clear")
         clear_btn.setFixedWidth(70)
-        clear_btn.setStyleSheet("""
-            QPushButton {
-                background:#F8FAFC;
-                border:1px solid #E2E8F0;
-                border-radius:8px;
-                padding:4px 10px;
-                font-size:12px;
-                color:#475569;
-            }
-            QPushButton:hover {
-                background:#F1F5F9;
-                border:1px solid #CBD5E1;
-            }
-        """)
+        clear_btn.setStyleSheet(_CLEAR_BTN_QSS)
 
         layout.addWidget(label)
         layout.addWidget(self._input, 1)   # <-- THIS makes it expand
@@ -176,30 +207,39 @@ class SortByWidget(QWidget):
         clear_btn.clicked.connect(self._clear)
 
     def _create_tag(self, text):
-        # Get direction for this specific field (default to ascending)
-        direction = self._field_directions.get(text, "asc")
-        arrow = "↑" if direction == "asc" else "↓"
-        tag = QPushButton(f"{text} {arrow}")
+        tag = QPushButton(self._tag_text(text))
         tag.setCursor(Qt.PointingHandCursor)
-        tag.setStyleSheet("""
-            QPushButton {
-                background:#EAF2FF;
-                color:#1E40AF;
-                padding:2px 8px;
-                border-radius:6px;
-                font-size:11px;
-                font-weight:500;
-                border:none;
-            }
-            QPushButton:hover {
-                background:#DBEAFE;
-            }
-        """)
+        tag.setStyleSheet(_TAG_QSS)
         # Store the field name for identification
         tag.setProperty("field_name", text)
-        tag.clicked.connect(lambda: self._toggle_tag_direction(text))
+        tag.clicked.connect(self._on_tag_clicked)
         return tag
 
+    @Slot()
+    def _on_tag_clicked(self):
+        # One shared slot for every tag; the field is read at click time so
+        # pooled buttons keep working after being relabelled.
+        self._toggle_tag_direction(self.sender().property("field_name"))
+
+    def _acquire_tag(self, field):
+        """Return a tag for *field*, recycling a pooled button when available."""
+        if not self._tag_pool:
+            return self._create_tag(field)
+        tag = self._tag_pool.pop()
+        tag.setText(self._tag_text(field))
+        tag.setProperty("field_name", field)
+        return tag
+
+    def _release_tag(self, tag):
+        self._tag_layout.removeWidget(tag)
+        tag.hide()
+        self._tag_pool.append(tag)
+
+    def _tag_text(self, field_name):
+        direction = self._field_directions.get(field_name, "asc")
+        arrow = "↑" if direction == "asc" else "↓"
+        return f"{field_name} {arrow}"
+
     def _toggle_tag_direction(self, field_name):
         """Toggle between ascending and descending for a specific field."""
         current = self._field_directions.get(field_name, "asc")
@@ -261,26 +301,42 @@ class SortByWidget(QWidget):
         if self._updating_text:
             return
 
-        for i in range(self._list.count()):
-            item = self._list.item(i)
-            item.setHidden(text.lower() not in item.text().lower())
+        needle = text.lower()
+        for i, field in enumerate(self._lower_fields):
+            self._list.item(i).setHidden(needle not in field)
 
     # -------------------------------------------------
     def _refresh_tags(self):
         """Refresh tag display to update arrow indicators."""
-        # clear tags
-        while self._tag_layout.count():
-            item = self._tag_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        # add tags with current direction
         for field in self._selected_fields:
-            tag = self._create_tag(field)
-            self._tag_layout.addWidget(tag)
-
-        self._input.updateGeometry()
-        self._input.repaint()
+            tag = self._tag_widgets.get(field)
+            if tag is not None:
+                tag.setText(self._tag_text(field))
+
+        # Tag count is unchanged, so only a (coalesced) repaint is needed
+        self._input.update()
+
+    def _sync_tags(self, prev_fields):
+        """Add/remove only the tags that changed and keep them in selection order."""
+        prev = set(prev_fields)
+        cur = set(self._selected_fields)
+
+        for field in prev - cur:
+            tag = self._tag_widgets.pop(field, None)
+            if tag is not None:
+                self._release_tag(tag)
+
+        added = cur - prev
+        for field in added:
+            self._tag_widgets[field] = self._acquire_tag(field)
+
+        for index, field in enumerate(self._selected_fields):
+            tag = self._tag_widgets[field]
+            if self._tag_layout.indexOf(tag) != index:
+                self._tag_layout.removeWidget(tag)
+                self._tag_layout.insertWidget(index, tag)
+            if field in added:
+                tag.show()
 
     # -------------------------------------------------
     # -------------------------------------------------
@@ -296,6 +352,7 @@ class SortByWidget(QWidget):
                 item.setSelected(False)
             selected_items = [item.text() for item in self._list.selectedItems()]
 
+        prev_fields = self._selected_fields
         self._selected_fields = selected_items
 
         # Initialize direction for newly selected fields
@@ -303,27 +360,23 @@ class SortByWidget(QWidget):
             if field not in self._field_directions:
                 self._field_directions[field] = "asc"
 
-        # update check icons
-        for i in range(self._list.count()):
-            item = self._list.item(i)
-            if item.text() in self._selected_fields:
-                item.setIcon(self._check_icon)
-            else:
-                item.setIcon(QIcon())
-
-        # clear tags
-        while self._tag_layout.count():
-            item = self._tag_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        # add tags
-        for field in self._selected_fields:
-            tag = self._create_tag(field)
-            self._tag_layout.addWidget(tag)
-
-        self._input.updateGeometry()
-        self._input.repaint()
+        # update check icons -- one viewport repaint instead of one per row
+        selected = set(self._selected_fields)
+        no_icon = QIcon()
+        self._list.setUpdatesEnabled(False)
+        try:
+            for i in range(self._list.count()):
+                item = self._list.item(i)
+                item.setIcon(self._check_icon if item.text() in selected else no_icon)
+        finally:
+            self._list.setUpdatesEnabled(True)
+        self._list.viewport().update()
+
+        self._sync_tags(prev_fields)
+
+        if len(prev_fields) != len(self._selected_fields):
+            self._input.updateGeometry()
+        self._input.update()
         self._emit_changed()
 
 
@@ -343,10 +396,9 @@ class SortByWidget(QWidget):
         self._selected_fields = []
         self._field_directions = {}
 
-        while self._tag_layout.count():
-            w = self._tag_layout.takeAt(0).widget()
-            if w:
-                w.deleteLater()
+        for tag in self._tag_widgets.values():
+            self._release_tag(tag)
+        self._tag_widgets.clear()
 
         self._emit_changed()
 
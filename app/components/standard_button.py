@@ -1,52 +1,83 @@
-import qtawesome as qta
 from PySide6.QtWidgets import QPushButton
 from PySide6.QtCore import Qt, QSize
 
+from components.icons import icon as _icon
+
+# Variants and their color schemes (Background, Hover, Text)
+_VARIANTS = {
+    "primary":   ("#3B82F6", "#2563EB", "#FFFFFF"),
+    "secondary": ("#FFFFFF", "#F9FAFB", "#374151"),
+    "danger":    ("#EF4444", "#DC2626", "#FFFFFF"),
+    "success":   ("#10B981", "#059669", "#FFFFFF"),
+}
+
+
+def _variant_style(variant: str, selector: str = "QPushButton") -> str:
+    bg, hover, text_color = _VARIANTS[variant]
+
+    # Border only for secondary
+    border_style = "border: 1px solid #E5E7EB;" if variant == "secondary" else "border: none;"
+
+    return f"""
+        {selector} {{
+            background-color: {bg};
+            color: {text_color};
+            border-radius: 6px;
+            padding: 0px 16px;
+            font-weight: 600;
+            font-size: 13px;
+            {border_style}
+        }}
+        {selector}:hover {{
+            background-color: {hover};
+        }}
+        {selector}:pressed {{
+            background-color: {bg};
+        }}
+        {selector}:disabled {{
+            background-color: #D1D5DB;
+            color: #9CA3AF;
+        }}
+    """
+
+
+# Built once at import; every button of a variant shares the same string
+_VARIANT_QSS = {variant: _variant_style(variant) for variant in _VARIANTS}
+
+# All variants keyed by the "variant" property, for containers that style many
+# StandardButtons from one sheet (see ``apply_style`` below)
+STANDARD_BUTTON_QSS = "".join(
+    _variant_style(variant, f'StandardButton[variant="{variant}"]') for variant in _VARIANTS
+)
+
 class StandardButton(QPushButton):
     """
     A custom button component with pre-defined styles for 
     Primary, Secondary, and Danger variants.
     """
-    def __init__(self, text, icon_name=None, variant="primary", parent=None):
+    variants = _VARIANTS
+
+    def __init__(self, text, icon_name=None, variant="primary", parent=None, apply_style=True):
+        """
+        :param apply_style: Set the variant stylesheet on the button itself.
+                            Pass False when an ancestor already carries
+                            ``STANDARD_BUTTON_QSS``.
+        """
         super().__init__(text, parent)
         self.setCursor(Qt.PointingHandCursor)
         self.setFixedHeight(38)
-        
-        # Variants and their color schemes (Background, Hover, Text)
-        self.variants = {
-            "primary":   ("#3B82F6", "#2563EB", "#FFFFFF"),
-            "secondary": ("#FFFFFF", "#F9FAFB", "#374151"),
-            "danger":    ("#EF4444", "#DC2626", "#FFFFFF"),
-            "success":   ("#10B981", "#059669", "#FFFFFF"),
-        }
-        
-        bg, hover, text_color = self.variants.get(variant, self.variants["primary"])
-        
-        # Border only for secondary
-        border_style = "border: 1px solid #E5E7EB;" if variant == "secondary" else "border: none;"
-        
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {bg};
-                color: {text_color};
-                border-radius: 6px;
-                padding: 0px 16px;
-                font-weight: 600;
-                font-size: 13px;
-                {border_style}
-            }}
-            QPushButton:hover {{
-                background-color: {hover};
-            }}
-            QPushButton:pressed {{
-                background-color: {bg};
-            }}
-            QPushButton:disabled {{
-                background-color: #D1D5DB;
-                color: #9CA3AF;
-            }}
-        """)
+
+        if variant not in _VARIANTS:
+            variant = "primary"
+        text_color = _VARIANTS[variant][2]
+
+        # Exposed for [variant="..."] selectors. Pages set unscoped background
+        # rules on their containers, which would beat an application-level
+        # stylesheet, so the variant sheet stays on the button or its owner.
+        self.setProperty("variant", variant)
+        if apply_style:
+            self.setStyleSheet(_VARIANT_QSS[variant])
 
         if icon_name:
-            self.setIcon(qta.icon(icon_name, color=text_color))
+            self.setIcon(_icon(icon_name, text_color))
             self.setIconSize(QSize(16, 16))
\ No newline at end of file
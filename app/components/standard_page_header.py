@@ -1,6 +1,6 @@
 from PySide6.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout, QLabel
 
-from components.standard_button import StandardButton
+from components.standard_button import StandardButton, STANDARD_BUTTON_QSS
 
 COLORS = {
     "text_primary": "#111827",
@@ -34,7 +34,9 @@ class StandardPageHeader(QWidget):
         """
         super().__init__()
 
-        self.setStyleSheet("background: transparent; border: none;")
+        # The toolbar buttons are styled from this one sheet rather than each
+        # parsing its own copy of the variant stylesheet.
+        self.setStyleSheet("* { background: transparent; border: none; }" + STANDARD_BUTTON_QSS)
 
         if enabled_actions is not None:
             enabled_actions = set(enabled_actions)
@@ -51,7 +53,7 @@ class StandardPageHeader(QWidget):
         # Create and add standard toolbar buttons
         self.action_buttons = {}
         for label, icon_name, variant in STANDARD_ACTIONS:
-            btn = StandardButton(label, icon_name=icon_name, variant=variant)
+            btn = StandardButton(label, icon_name=icon_name, variant=variant, apply_style=False)
             if enabled_actions is not None and label not in enabled_actions:
                 btn.setEnabled(False)
             self.action_buttons[label] = btn
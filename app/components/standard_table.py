@@ -1,8 +1,9 @@
 from PySide6.QtWidgets import (
     QTableWidget, QTableWidgetItem, QHeaderView, QFrame, QVBoxLayout,
-    QAbstractItemView, QWidget
+    QAbstractItemView, QWidget, QLabel, QLineEdit, QAbstractButton,
+    QSpinBox, QDoubleSpinBox, QAbstractSlider
 )
-from PySide6.QtCore import Qt, QTimer, Signal
+from PySide6.QtCore import Qt, QTimer, Signal, QSignalBlocker
 from PySide6.QtGui import QFont
 from components.pagination_widget import PaginationWidget
 
@@ -27,12 +28,10 @@ class _Theme:
     font_weight_header = "bold"
 
 
-# Style sheets
-def _container_style() -> str:
-    t = _Theme
-    return f"""
+# Style sheets (built once at import; _Theme values are constants)
+_CONTAINER_STYLE = f"""
         StandardTable {{
-            background-color: {t.bg};
+            background-color: {_Theme.bg};
             border: none;              /* Let pages decide surrounding borders; keeps pagination clean */
             border-radius: 0px;
         }}
@@ -43,12 +42,12 @@ def _container_style() -> str:
             border: none;
         }}
         StandardTable QScrollBar::handle:vertical {{
-            background: {t.scrollbar_handle};
+            background: {_Theme.scrollbar_handle};
             min-height: 28px;
             border-radius: 4px;
         }}
         StandardTable QScrollBar::handle:vertical:hover {{
-            background: {t.scrollbar_hover};
+            background: {_Theme.scrollbar_hover};
         }}
         StandardTable QScrollBar::add-line:vertical,
         StandardTable QScrollBar::sub-line:vertical {{
@@ -62,12 +61,12 @@ def _container_style() -> str:
             border: none;
         }}
         StandardTable QScrollBar::handle:horizontal {{
-            background: {t.scrollbar_handle};
+            background: {_Theme.scrollbar_handle};
             min-width: 28px;
             border-radius: 4px;
         }}
         StandardTable QScrollBar::handle:horizontal:hover {{
-            background: {t.scrollbar_hover};
+            background: {_Theme.scrollbar_hover};
         }}
         StandardTable QScrollBar::add-line:horizontal,
         StandardTable QScrollBar::sub-line:horizontal {{
@@ -76,30 +75,28 @@ def _container_style() -> str:
         }}
     """
 
-def _table_style() -> str:
-    t = _Theme
-    return f"""
+_TABLE_STYLE = f"""
         QTableWidget {{
-            background-color: {t.bg};
-            gridline-color: {t.border};
+            background-color: {_Theme.bg};
+            gridline-color: {_Theme.border};
         }}
         QTableWidget::item {{
             padding: 2px 6px;
-            color: {t.text_main};
-            font-size: {t.font_size_body};
+            color: {_Theme.text_main};
+            font-size: {_Theme.font_size_body};
             border: none;
         }}
         QTableWidget::item:selected {{
-            background-color: {t.selection_bg};
-            color: {t.text_main};
+            background-color: {_Theme.selection_bg};
+            color: {_Theme.text_main};
         }}
         QHeaderView::section {{
-            background-color: {t.header_bg};
-            color: {t.text_header};
+            background-color: {_Theme.header_bg};
+            color: {_Theme.text_header};
             padding: 3px 6px;
-            font-size: {t.font_size_header};
-            font-weight: {t.font_weight_header};
-            border: 1px solid {t.border};
+            font-size: {_Theme.font_size_header};
+            font-weight: {_Theme.font_weight_header};
+            border: 1px solid {_Theme.border};
         }}
         QHeaderView::down-arrow,
         QHeaderView::up-arrow {{
@@ -107,25 +104,38 @@ def _table_style() -> str:
             height: 0px;
         }}
         QTableCornerButton::section {{
-            background-color: {t.row_number_bg};
-            border: 1px solid {t.border};
+            background-color: {_Theme.row_number_bg};
+            border: 1px solid {_Theme.border};
         }}
     """
 
-def _row_number_style() -> str:
-    t = _Theme
-    return f"""
-        QHeaderView::section {{
-            background-color: {t.row_number_bg};
-            color: {t.text_main};
+_ROW_NUMBER_STYLE = f"""
+        QHeaderView#RowNumberHeader::section {{
+            background-color: {_Theme.row_number_bg};
+            color: {_Theme.text_main};
             padding: 2px 4px;
-            font-size: {t.font_size_header};
-            font-weight: {t.font_weight_header};
-            border: 1px solid {t.border};
+            font-size: {_Theme.font_size_header};
+            font-weight: {_Theme.font_weight_header};
+            border: 1px solid {_Theme.border};
         }}
     """
 
+# Combined sheet set once on each table's frame
+_STANDARD_TABLE_STYLE = _CONTAINER_STYLE + _TABLE_STYLE + _ROW_NUMBER_STYLE
+
 # Header configuration helpers
+_BOLD_HEADER_FONT = None
+
+
+def _bold_header_font() -> QFont:
+    """Shared bold header font, created on first use (after QApplication exists)."""
+    global _BOLD_HEADER_FONT
+    if _BOLD_HEADER_FONT is None:
+        _BOLD_HEADER_FONT = QFont()
+        _BOLD_HEADER_FONT.setBold(True)
+    return _BOLD_HEADER_FONT
+
+
 def _configure_horizontal_header(header: QHeaderView) -> None:
     """Compact, horizontally scrollable column headers."""
     header.setMinimumHeight(_Theme.header_height)
@@ -135,10 +145,7 @@ def _configure_horizontal_header(header: QHeaderView) -> None:
     header.setSectionResizeMode(QHeaderView.Interactive)
     header.setSortIndicatorShown(False)
     header.setSectionsClickable(False)
-    
-    header_font = QFont()
-    header_font.setBold(True)
-    header.setFont(header_font)
+    header.setFont(_bold_header_font())
 
 
 def _configure_vertical_header(header: QHeaderView) -> None:
@@ -147,11 +154,44 @@ def _configure_vertical_header(header: QHeaderView) -> None:
     header.setDefaultSectionSize(_Theme.row_height)
     header.setMinimumWidth(_Theme.row_number_width)
     header.setDefaultAlignment(Qt.AlignCenter | Qt.AlignVCenter)
-    header.setStyleSheet(_row_number_style())
-    
-    header_font = QFont()
-    header_font.setBold(True)
-    header.setFont(header_font)
+    # Styled by the #RowNumberHeader rule in the table's shared sheet
+    header.setObjectName("RowNumberHeader")
+    header.setFont(_bold_header_font())
+
+# Sorting helpers
+_STRIP_COMMAS = str.maketrans("", "", ",")
+
+# Text not starting with one of these can't be a number; skip float()
+_NUMERIC_START = frozenset("+-.0123456789")
+
+# Cell widget types read directly, without probing attributes
+_TEXT_WIDGETS = (QLabel, QLineEdit, QAbstractButton)
+_VALUE_WIDGETS = (QSpinBox, QDoubleSpinBox, QAbstractSlider)
+
+# Rows inspected when deciding whether a column holds numbers
+_NUMERIC_SAMPLE_ROWS = 20
+
+
+def _sort_key(value):
+    """Order numbers before text so mixed columns never compare float to str."""
+    if isinstance(value, (int, float)):
+        return (0, value)
+    return (1, value)
+
+
+class _Descending:
+    """Inverts the ordering of a sort key, so one stable sort can mix directions."""
+    __slots__ = ("key",)
+
+    def __init__(self, key):
+        self.key = key
+
+    def __lt__(self, other):
+        return other.key < self.key
+
+    def __eq__(self, other):
+        return self.key == other.key
+
 
 # Main widget
 class StandardTable(QFrame):
@@ -178,12 +218,18 @@ class StandardTable(QFrame):
     def __init__(self, headers: list[str], parent=None) -> None:
         super().__init__(parent)
         self._headers = headers
-        self._original_data = []  # Store original row data for sorting
+        self._header_index = {h: i for i, h in enumerate(headers)}
+        # Original position of each current row, used to undo sorting
+        self._row_order: list[int] = []
+        # (fields, directions) of the sort currently applied, if still valid
+        self._last_sort_sig = None
         self._build_ui()
 
     # Construction
     def _build_ui(self) -> None:
-        self.setStyleSheet(_container_style())
+        # One sheet on the frame styles the table and both headers, so Qt
+        # parses and polishes a single stylesheet per StandardTable.
+        self.setStyleSheet(_STANDARD_TABLE_STYLE)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -206,7 +252,6 @@ class StandardTable(QFrame):
         table.setSortingEnabled(False)
         table.setShowGrid(True)
         table.setFrameShape(QFrame.StyledPanel)
-        table.setStyleSheet(_table_style())
 
         table.setWordWrap(True)
         table.setTextElideMode(Qt.ElideNone)
@@ -217,7 +262,8 @@ class StandardTable(QFrame):
 
         table.setEditTriggers(QAbstractItemView.NoEditTriggers)
 
-        table.itemDoubleClicked.connect(self._handle_double_click)
+        # Index-based so double-clicking an empty (item-less) cell still works
+        table.doubleClicked.connect(self._handle_double_click)
 
         table.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
         table.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
@@ -230,18 +276,33 @@ class StandardTable(QFrame):
         table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
         table.verticalHeader().setMinimumSectionSize(_Theme.row_height)
 
-        table.model().rowsInserted.connect(
-            lambda *_: QTimer.singleShot(0, table.resizeRowsToContents)
-        )
+        # Pages insert rows one at a time; coalesce the per-row resize
+        # requests into a single resizeRowsToContents on the next loop turn.
+        self._resize_rows_timer = QTimer(self)
+        self._resize_rows_timer.setSingleShot(True)
+        self._resize_rows_timer.setInterval(0)
+        self._resize_rows_timer.timeout.connect(table.resizeRowsToContents)
 
-        table.horizontalHeader().sectionResized.connect(
-            lambda *_: QTimer.singleShot(0, table.resizeRowsToContents)
-        )
+        table.model().rowsInserted.connect(self._schedule_resize_rows)
+        table.horizontalHeader().sectionResized.connect(self._schedule_resize_rows)
+
+        # Any change to the cells means a repeated sort request must re-run
+        model = table.model()
+        for signal in (model.dataChanged, model.rowsInserted,
+                       model.rowsRemoved, model.modelReset):
+            signal.connect(self._invalidate_sort)
 
         return table
+
+    def _invalidate_sort(self, *_):
+        self._last_sort_sig = None
+
+    def _schedule_resize_rows(self, *_):
+        if not self._resize_rows_timer.isActive():
+            self._resize_rows_timer.start()
     
-    def _handle_double_click(self, item):
-        row = item.row()
+    def _handle_double_click(self, index):
+        row = index.row()
         row_data = []
 
         for col in range(self.table.columnCount()):
@@ -251,27 +312,21 @@ class StandardTable(QFrame):
         self.rowDoubleClicked.emit(row_data)
 
     # Internal helpers
-    def _fill_empty_cells(self, row: int) -> None:
+    def _get_cell_sort_value(self, row: int, col: int, numeric: bool = True):
         """
-        Ensure every cell in *row* has a QTableWidgetItem.
+        Extract sortable value from a cell (handles widgets and items).
 
-        Qt only draws gridlines around cells that have an item; without
-        this, rows whose data is partially or fully absent look broken —
-        the grid lines simply vanish for the empty columns.  Inserting a
-        blank, non-editable item costs nothing visually but guarantees
-        consistent borders across every row.
+        With *numeric* False the float conversion is skipped; used for
+        columns already known to hold text. Text is casefolded here, once
+        per cell, so comparisons during the sort allocate nothing.
         """
-        for col in range(self.table.columnCount()):
-            if self.table.item(row, col) is None:
-                placeholder = QTableWidgetItem("")
-                placeholder.setFlags(placeholder.flags() & ~Qt.ItemIsEditable)
-                self.table.setItem(row, col, placeholder)
-
-    def _get_cell_sort_value(self, row: int, col: int):
-        """Extract sortable value from a cell (handles widgets and items)."""
         widget = self.table.cellWidget(row, col)
         if widget:
-            # If it's a widget, try to get its text or value
+            # Known widget types first; attribute probing only for the rest
+            if isinstance(widget, _TEXT_WIDGETS):
+                return widget.text()
+            if isinstance(widget, _VALUE_WIDGETS):
+                return widget.value()
             if hasattr(widget, 'text'):
                 return widget.text()
             elif hasattr(widget, 'value'):
@@ -282,12 +337,25 @@ class StandardTable(QFrame):
         if item:
             text = item.text()
             # Convert to number if possible for better numeric sorting
-            try:
-                return float(text.replace(',', ''))
-            except (ValueError, AttributeError):
-                return text.lower() if text else ""
+            if numeric and text and text[0] in _NUMERIC_START:
+                try:
+                    return float(text.translate(_STRIP_COMMAS))
+                except ValueError:
+                    pass
+            return text.casefold()
         return ""
 
+    def _detect_numeric_columns(self, columns) -> set:
+        """Return the subset of *columns* whose leading cells parse as numbers."""
+        numeric = set()
+        sample = min(self.table.rowCount(), _NUMERIC_SAMPLE_ROWS)
+        for col in columns:
+            for row in range(sample):
+                if isinstance(self._get_cell_sort_value(row, col), (int, float)):
+                    numeric.add(col)
+                    break
+        return numeric
+
     def sort_by_fields(self, fields: list[str], field_directions: dict) -> None:
         """
         Sort table by multiple fields with individual directions.
@@ -302,128 +370,172 @@ class StandardTable(QFrame):
         if not fields:
             # If no sort fields, restore original order
             self._restore_original_order()
+            self._last_sort_sig = None
+            return
+
+        # Same fields and directions over unchanged rows: already sorted
+        sig = (tuple(fields), tuple(field_directions.get(f, "asc") for f in fields))
+        if sig == self._last_sort_sig:
             return
         
         # Get column indices for each field
-        header_map = {self._headers[i]: i for i in range(len(self._headers))}
         sort_columns = []
         for field in fields:
-            if field in header_map:
-                col_idx = header_map[field]
+            col_idx = self._header_index.get(field)
+            if col_idx is not None:
                 reverse = field_directions.get(field, "asc") == "desc"
                 sort_columns.append((col_idx, reverse))
         
         if not sort_columns:
             return
         
-        # Collect all row data
+        # Sort values are computed once, only for the sort columns, and
+        # text columns skip the float conversion entirely.
+        sort_cols = {col_idx for col_idx, _ in sort_columns}
+        numeric_cols = self._detect_numeric_columns(sort_cols)
+
+        # One stable pass over a composite key; descending columns are inverted
+        def sort_key(entry):
+            row_items = entry[1]
+            return tuple(
+                _Descending(row_items[col_idx][2]) if reverse
+                else row_items[col_idx][2]
+                for col_idx, reverse in sort_columns
+            )
+
+        self._begin_bulk_update()
+        try:
+            rows_data = self._collect_rows(sort_cols, numeric_cols)
+            rows_data.sort(key=sort_key)
+            self._repopulate(rows_data)
+        finally:
+            self._end_bulk_update()
+
+        # Set after the rebuild, whose own model signals clear it
+        self._last_sort_sig = sig
+
+    def _collect_rows(self, sort_cols=(), numeric_cols=()) -> list:
+        """
+        Take every row out as ``(original_position, row_items)``.
+
+        ``row_items`` holds one ``(kind, payload, sort_key)`` tuple per
+        column; sort keys are precomputed, and only for *sort_cols*. Items
+        are moved out with ``takeItem`` rather than copied, so callers must
+        hand the result to ``_repopulate`` inside a bulk update.
+        """
+        self._sync_row_order()
         row_count = self.table.rowCount()
-        rows_data = []
-        
+        col_count = self.table.columnCount()
+        # Sizes are known up front, so fill preallocated lists by index
+        rows_data = [None] * row_count
+        # Each takeItem emits dataChanged, which makes the ResizeToContents
+        # row header re-measure; the rows are dropped right after anyway.
+        model_blocker = QSignalBlocker(self.table.model())
+
         for row in range(row_count):
-            row_items = []
-            for col in range(self.table.columnCount()):
+            row_items = [None] * col_count
+            for col in range(col_count):
                 item = self.table.item(row, col)
                 widget = self.table.cellWidget(row, col)
+                value = (
+                    _sort_key(self._get_cell_sort_value(row, col, col in numeric_cols))
+                    if col in sort_cols else ""
+                )
                 
                 if widget:
                     # Store widget reference and its data
-                    row_items.append(('widget', widget, self._get_cell_sort_value(row, col)))
+                    row_items[col] = ('widget', widget, value)
                 elif item:
-                    # Clone the item
-                    new_item = QTableWidgetItem(item)
-                    row_items.append(('item', new_item, self._get_cell_sort_value(row, col)))
+                    # Move the item itself; _repopulate puts it back
+                    row_items[col] = ('item', self.table.takeItem(row, col), value)
                 else:
-                    row_items.append(('empty', None, ""))
+                    row_items[col] = ('empty', None, value)
             
-            rows_data.append(row_items)
-        
-        # Sort using multiple keys
-        def sort_key(row_data):
-            keys = []
-            for col_idx, _ in sort_columns:
-                keys.append(row_data[col_idx][2])  # The sort value
-            return keys
-        
-        # Apply sorting with proper direction for each field
-        for col_idx, reverse in reversed(sort_columns):  # Reverse to apply in priority order
-            rows_data.sort(key=lambda r: r[col_idx][2], reverse=reverse)
-        
-        # Clear table and repopulate
+            rows_data[row] = (self._row_order[row], row_items)
+
+        model_blocker.unblock()
+        return rows_data
+
+    def _repopulate(self, rows_data: list) -> None:
+        """Rewrite the table from ``_collect_rows`` output, in list order."""
+        # Drop the old rows, then allocate all rows at once and fill by index
         self.table.setRowCount(0)
-        
-        for row_items in rows_data:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            
+        self.table.setRowCount(len(rows_data))
+
+        for row, (_, row_items) in enumerate(rows_data):
             for col, (item_type, item_data, _) in enumerate(row_items):
                 if item_type == 'widget':
                     self.table.setCellWidget(row, col, item_data)
                 elif item_type == 'item':
                     self.table.setItem(row, col, item_data)
-                else:
-                    placeholder = QTableWidgetItem("")
-                    placeholder.setFlags(placeholder.flags() & ~Qt.ItemIsEditable)
-                    self.table.setItem(row, col, placeholder)
+
+        self._row_order = [position for position, _ in rows_data]
+
+    def _begin_bulk_update(self) -> None:
+        """Suspend painting and item signals while many cells change."""
+        self._had_selection = bool(self.table.selectedItems())
+        self.table.setUpdatesEnabled(False)
+        self.table.horizontalHeader().setUpdatesEnabled(False)
+        self._signal_blocker = QSignalBlocker(self.table)
+
+    def _end_bulk_update(self) -> None:
+        self._signal_blocker.unblock()
+        self._signal_blocker = None
+        self.table.horizontalHeader().setUpdatesEnabled(True)
+        self.table.setUpdatesEnabled(True)
+        self.table.viewport().update()
+        # Rebuilding rows drops the selection; tell listeners once it is gone
+        if self._had_selection and not self.table.selectedItems():
+            self.table.itemSelectionChanged.emit()
+
+    def _sync_row_order(self) -> None:
+        """
+        Keep ``_row_order`` aligned with the table.
+
+        Rows added straight through ``self.table`` bypass the bookkeeping;
+        if the lengths disagree, the current order becomes the original.
+        """
+        if len(self._row_order) != self.table.rowCount():
+            self._row_order = list(range(self.table.rowCount()))
 
     def _restore_original_order(self) -> None:
         """Restore the table to its original unsorted order."""
-        if not self._original_data:
+        self._sync_row_order()
+        if all(pos == row for row, pos in enumerate(self._row_order)):
             return
-        
-        self.table.setRowCount(0)
-        for row_items in self._original_data:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            
-            for col, (item_type, item_data) in enumerate(row_items):
-                if item_type == 'widget':
-                    # Create a new instance or clone if possible
-                    self.table.setCellWidget(row, col, item_data)
-                elif item_type == 'item':
-                    self.table.setItem(row, col, QTableWidgetItem(item_data))
-                else:
-                    placeholder = QTableWidgetItem("")
-                    placeholder.setFlags(placeholder.flags() & ~Qt.ItemIsEditable)
-                    self.table.setItem(row, col, placeholder)
-
-    def _store_original_data(self) -> None:
-        """Store current table data for later restoration."""
-        self._original_data = []
-        for row in range(self.table.rowCount()):
-            row_items = []
-            for col in range(self.table.columnCount()):
-                widget = self.table.cellWidget(row, col)
-                item = self.table.item(row, col)
-                
-                if widget:
-                    row_items.append(('widget', widget))
-                elif item:
-                    row_items.append(('item', QTableWidgetItem(item)))
-                else:
-                    row_items.append(('empty', None))
-            
-            self._original_data.append(row_items)
+
+        self._begin_bulk_update()
+        try:
+            rows_data = self._collect_rows()
+            rows_data.sort(key=lambda entry: entry[0])
+            self._repopulate(rows_data)
+        finally:
+            self._end_bulk_update()
 
     def row_count(self) -> int:
         return self.table.rowCount()
 
     def set_row_count(self, count: int) -> None:
-        """Set total row count, filling any new rows with blank items."""
-        self.table.setRowCount(count)
-        for row in range(count):
-            self._fill_empty_cells(row)
-        self._store_original_data()
+        """Set total row count; new rows start empty (grid lines still draw)."""
+        self._begin_bulk_update()
+        try:
+            self.table.setRowCount(count)
+        finally:
+            self._end_bulk_update()
+        self._row_order = list(range(count))
 
     def insert_row(self, row: int) -> None:
-        """Insert a blank row at *row*, pre-filled so grid lines appear."""
+        """Insert a blank row at *row*."""
+        self._sync_row_order()
         self.table.insertRow(row)
-        self._fill_empty_cells(row)
+        self._row_order.insert(row, len(self._row_order))
 
     def set_item(self, row: int, col: int, item) -> None:
         self.table.setItem(row, col, item)
 
     def set_cell_widget(self, row: int, col: int, widget) -> None:
+        # Index widgets don't go through the model, so invalidate by hand
+        self._last_sort_sig = None
         self.table.setCellWidget(row, col, widget)
 
     def set_row_height(self, row: int, height: int) -> None:
@@ -432,7 +544,7 @@ class StandardTable(QFrame):
     def clear(self) -> None:
         """Remove all rows (keeps headers)."""
         self.table.setRowCount(0)
-        self._original_data = []
+        self._row_order = []
 
     def headers(self) -> list[str]:
         """Return the logical column headers used by this table."""
@@ -448,26 +560,25 @@ class StandardTable(QFrame):
             - ``QTableWidgetItem`` -> set directly
             - ``QWidget``          -> embedded via setCellWidget
             - ``str``              -> wrapped in a QTableWidgetItem
-            - ``None`` / missing   -> blank placeholder (grid lines preserved)
+            - ``None`` / missing   -> left empty
 
-        Any columns beyond ``len(items)`` are also filled with blank
-        placeholders so grid lines remain consistent.
+        Empty cells need no placeholder item: the view draws grid lines for
+        every cell, with or without an item.
         """
+        self._sync_row_order()
         row = self.table.rowCount()
         self.table.insertRow(row)
+        self._row_order.append(row)
 
         for col, item in enumerate(items):
             if isinstance(item, QWidget):
                 self.table.setCellWidget(row, col, item)
             elif isinstance(item, QTableWidgetItem):
                 self.table.setItem(row, col, item)
-            else:
-                # str, int, float, None — coerce to a plain text item
-                cell = QTableWidgetItem("" if item is None else str(item))
-                self.table.setItem(row, col, cell)
+            elif item is not None:
+                # str, int, float — coerce to a plain text item
+                self.table.setItem(row, col, QTableWidgetItem(str(item)))
 
-        # Fill any trailing columns not covered by `items`
-        self._fill_empty_cells(row)
         return row
 
     # Backwards-compatible camelCase aliases
@@ -1,14 +1,77 @@
-import qtawesome as qta
+import os
+
 from PySide6.QtWidgets import (
     QFrame, QVBoxLayout, QHBoxLayout, QLabel,
-    QPushButton, QWidget, QScrollArea, QGraphicsOpacityEffect,
+    QPushButton, QWidget, QScrollArea,
     QSizePolicy,
 )
-from PySide6.QtCore import Qt, QSize, QPropertyAnimation, QEasingCurve, Signal
+from PySide6.QtCore import Qt, QSize, QPropertyAnimation, QEasingCurve, Signal, Slot, Property
+from PySide6.QtGui import QPixmap, QPixmapCache, QPainter, QColor, QPen, QGuiApplication
+
+from components.icons import icon as _icon, icon_pixmap
+
+# Set SIDEBAR_NO_ANIM=1 to snap menus and width instead of animating them
+# (reduced-motion preference, low-power or remote-desktop sessions).
+ANIMATIONS_ENABLED = not os.getenv("SIDEBAR_NO_ANIM")
 
 # --- Style Constants ---
-STYLE_NORMAL = """
-    QPushButton {
+# One sheet on the Sidebar styles every child by object name; state changes
+# flip a dynamic property and repolish instead of swapping stylesheets.
+SIDEBAR_QSS = """
+    QFrame {
+        background-color: #E2E8F0;
+        border-right: 1px solid #CBD5E1;
+    }
+    #SidebarPane, #SidebarPane * {
+        background: transparent;
+    }
+    #content_container {
+        background: #E2E8F0;
+    }
+    #user_panel {
+        background-color: #E2E8F0;
+        border-top: 1px solid #CBD5E1;
+    }
+    #SidebarMenuHeader:hover {
+        background-color: #F1F5F9;
+        border-radius: 6px;
+    }
+    #SidebarResizeHandle {
+        background: transparent;
+    }
+    #SidebarResizeHandle:hover {
+        background: #A5B4FC;
+        border-radius: 2px;
+    }
+
+    /* Scroll area */
+    QScrollArea#SidebarScroll { background: transparent; border: none; }
+    #SidebarScroll QScrollBar:vertical { background: transparent; width: 6px; margin: 0px; }
+    #SidebarScroll QScrollBar::handle:vertical { background: #D1D5DB; border-radius: 3px; min-height: 30px; }
+    #SidebarScroll QScrollBar::handle:vertical:hover { background: #9CA3AF; }
+    #SidebarScroll QScrollBar::add-line:vertical, #SidebarScroll QScrollBar::sub-line:vertical { height: 0px; }
+    #SidebarScroll QScrollBar::add-page:vertical, #SidebarScroll QScrollBar::sub-page:vertical { background: none; }
+
+    /* Labels */
+    QLabel#SidebarTitle {
+        font-size: 17px; font-weight: 700; color: #111827; background: transparent;
+    }
+    QLabel#SidebarMenuTitle {
+        font-size: 13px; font-weight: 600; color: #1E293B; border: none; background: transparent;
+    }
+    QLabel#SidebarChevron, QLabel#SidebarAvatar {
+        background: transparent; border: none;
+    }
+    QLabel#SidebarUserInfo {
+        font-size: 12px; font-weight: 600; color: #111827; background: transparent; border: none;
+    }
+    QLabel#SidebarSectionLabel {
+        font-size: 10px; color: #9CA3AF; font-weight: 700;
+        letter-spacing: 0.8px; padding: 6px 12px 4px 12px; background: transparent;
+    }
+
+    /* Sub-menu items */
+    QPushButton#SidebarSubItem {
         text-align: left;
         padding: 9px 14px;
         border: none;
@@ -18,39 +81,124 @@ STYLE_NORMAL = """
         outline: none;
         border-radius: 6px;
     }
-    QPushButton:hover {
+    QPushButton#SidebarSubItem:hover {
         color: #1E293B;
         background-color: #F1F5F9;
     }
-"""
-
-STYLE_ACTIVE = """
-    QPushButton {
-        text-align: left;
-        padding: 9px 14px;
-        border: none;
+    QPushButton#SidebarSubItem[active="true"] {
         color: #1E40AF;
-        font-size: 13px;
         font-weight: 600;
         background-color: #EFF6FF;
-        border-radius: 6px;
-        outline: none;
     }
-"""
 
-ICON_BTN_STYLE = """
-    QPushButton {{
-        background: {bg};
+    /* Icon buttons */
+    QPushButton#SidebarToggle {
+        background: transparent; border: none;
+        border-radius: 8px; outline: none;
+    }
+    QPushButton#SidebarToggle:hover { background-color: #CBD5E1; }
+    QPushButton#SidebarIconBtn {
+        background: transparent;
         border: none;
         border-radius: 8px;
         outline: none;
-    }}
-    QPushButton:hover {{
+    }
+    QPushButton#SidebarIconBtn[active="true"] {
+        background: #EFF6FF;
+    }
+    QPushButton#SidebarIconBtn:hover {
         background-color: #E2E8F0;
-    }}
+    }
+    QPushButton#SidebarExit { background:transparent; border:none; border-radius:6px; outline:none; }
+    QPushButton#SidebarExit:hover { background-color:#FEE2E2; }
 """
 
 
+# Menu layout: (title, icon, ((sub-item label, page id), ...)), in display order
+MENU_SPEC = (
+    ("File",    "fa5s.folder",   (("Dashboard", 0),)),
+    ("Master",  "fa5s.database", (
+        ("Source Data Group",   2),
+        ("Master Sticker",      3),
+        ("Master Filter Type",  4),
+        ("Master Brand",        5),
+        ("Master Product Type", 6),
+        ("Master Item",         7),
+        ("Master Brand Case",   8),
+    )),
+    ("Barcode", "fa5s.barcode",  (
+        ("Barcode Design", 9),
+        ("Barcode Print",  10),
+    )),
+)
+
+# page id -> (sub-item label, menu index), derived from MENU_SPEC
+_PAGE_ITEMS = {
+    page_id: (label, menu_idx)
+    for menu_idx, (_, _, items) in enumerate(MENU_SPEC)
+    for label, page_id in items
+}
+
+
+def _set_active(widget: QWidget, active: bool):
+    if widget.property("active") == active:
+        return
+    widget.setProperty("active", active)
+    # Re-evaluate the [active="true"] rules from SIDEBAR_QSS
+    widget.style().unpolish(widget)
+    widget.style().polish(widget)
+
+
+def _vbox(parent, margins=(0, 0, 0, 0), spacing=0) -> QVBoxLayout:
+    """QVBoxLayout on *parent* with margins and spacing set in one call.
+
+    ``spacing=None`` keeps the style's default spacing.
+    """
+    layout = QVBoxLayout(parent)
+    layout.setContentsMargins(*margins)
+    if spacing is not None:
+        layout.setSpacing(spacing)
+    return layout
+
+
+def _hbox(parent, margins=(0, 0, 0, 0), spacing=0) -> QHBoxLayout:
+    """QHBoxLayout counterpart of :func:`_vbox`."""
+    layout = QHBoxLayout(parent)
+    layout.setContentsMargins(*margins)
+    if spacing is not None:
+        layout.setSpacing(spacing)
+    return layout
+
+
+def _avatar_pixmap(size: int = 36) -> QPixmap:
+    """User avatar with its circle baked in, drawn once and kept in QPixmapCache."""
+    key = f"sidebar|avatar|{size}"
+    pm = QPixmapCache.find(key)
+    if pm is None:
+        dpr = QGuiApplication.instance().devicePixelRatio()
+        pm = QPixmap(int(size * dpr), int(size * dpr))
+        pm.setDevicePixelRatio(dpr)
+        pm.fill(Qt.transparent)
+        p = QPainter(pm)
+        p.setRenderHint(QPainter.Antialiasing)
+        p.setBrush(QColor("#EFF6FF"))
+        p.setPen(QPen(QColor("#DBEAFE"), 2))
+        p.drawEllipse(1, 1, size - 2, size - 2)
+        p.drawPixmap((size - 16) // 2, (size - 16) // 2, icon_pixmap("fa5s.user", "#2563EB", 16, 16))
+        p.end()
+        QPixmapCache.insert(key, pm)
+    return pm
+
+
+def preload_icons():
+    """Render the sidebar's glyphs ahead of time so building it after login is cheap."""
+    for _, icon, _ in MENU_SPEC:
+        icon_pixmap(icon, "#475569", 18, 18)
+    for code in ("fa5s.chevron-down", "fa5s.chevron-right"):
+        icon_pixmap(code, "#94A3B8", 10, 10)
+    _avatar_pixmap()
+
+
 # ── Drag-resize handle ────────────────────────────────────────────────────────
 
 class _ResizeHandle(QWidget):
@@ -62,7 +210,7 @@ class _ResizeHandle(QWidget):
         self._drag_start_width = 0
         self.setFixedWidth(5)
         self.setCursor(Qt.SizeHorCursor)
-        self.setStyleSheet("background: transparent;")
+        self.setObjectName("SidebarResizeHandle")
 
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
@@ -86,17 +234,14 @@ class _ResizeHandle(QWidget):
         self._dragging = False
         event.accept()
 
-    def enterEvent(self, event):
-        self.setStyleSheet("background: #A5B4FC; border-radius: 2px;")
-
-    def leaveEvent(self, event):
-        self.setStyleSheet("background: transparent;")
-
 
 # ── Collapsible menu ──────────────────────────────────────────────────────────
 
 class CollapsibleMenu(QWidget):
-    def __init__(self, title, icon_name, sub_items_dict, sidebar_ref):
+    # Chevron pixmap per expanded state, shared by every menu
+    _chevron_cache: dict[bool, QPixmap] = {}
+
+    def __init__(self, title, icon_name, items, sidebar_ref):
         super().__init__()
         self.sidebar_ref = sidebar_ref
         self.sub_buttons = []
@@ -104,27 +249,21 @@ class CollapsibleMenu(QWidget):
         self._icon_name = icon_name
         self._title = title
 
-        self.main_layout = QVBoxLayout(self)
-        self.main_layout.setContentsMargins(0, 0, 0, 0)
-        self.main_layout.setSpacing(0)
+        self.main_layout = _vbox(self)
 
         # Header
         self.header_widget = QWidget()
-        self.header_widget.setStyleSheet("background: transparent;")
-        self.header_layout = QHBoxLayout(self.header_widget)
-        self.header_layout.setContentsMargins(14, 10, 14, 10)
+        self.header_widget.setObjectName("SidebarMenuHeader")
+        self.header_layout = _hbox(self.header_widget, (14, 10, 14, 10), spacing=None)
 
         self.icon_label = QLabel()
-        self.icon_label.setStyleSheet("background: transparent;")
-        self.icon_label.setPixmap(qta.icon(icon_name, color="#475569").pixmap(QSize(18, 18)))
+        self.icon_label.setPixmap(icon_pixmap(icon_name, "#475569", 18, 18))
 
         self.title_label = QLabel(title)
-        self.title_label.setStyleSheet(
-            "font-size: 13px; font-weight: 600; color: #1E293B; border: none; background: transparent;"
-        )
+        self.title_label.setObjectName("SidebarMenuTitle")
 
         self.chevron_label = QLabel()
-        self.chevron_label.setStyleSheet("background: transparent; border: none;")
+        self.chevron_label.setObjectName("SidebarChevron")
         self._update_chevron()
 
         self.header_layout.addWidget(self.icon_label)
@@ -135,47 +274,55 @@ class CollapsibleMenu(QWidget):
 
         self.header_widget.setCursor(Qt.PointingHandCursor)
         self.header_widget.mousePressEvent = self.toggle_expansion
-        self.header_widget.enterEvent = lambda e: self._on_hover(True)
-        self.header_widget.leaveEvent = lambda e: self._on_hover(False)
         self.main_layout.addWidget(self.header_widget)
 
         # Sub-menu container
         self.container = QWidget()
-        self.container_layout = QVBoxLayout(self.container)
-        self.container.setStyleSheet("QWidget { background: transparent; }")
-        self.container_layout.setContentsMargins(28, 4, 0, 4)
-        self.container_layout.setSpacing(1)
+        self.container_layout = _vbox(self.container, (28, 4, 0, 4), 1)
 
-        for item_text, callback in sub_items_dict.items():
-            sub_btn = QPushButton(item_text)
-            sub_btn.setCursor(Qt.PointingHandCursor)
-            sub_btn.setFocusPolicy(Qt.NoFocus)
-            sub_btn.setStyleSheet(STYLE_NORMAL)
-            sub_btn.clicked.connect(
-                lambda chk=False, b=sub_btn, c=callback: self._on_sub_clicked(b, c)
-            )
-            self.sub_buttons.append(sub_btn)
-            self.container_layout.addWidget(sub_btn)
+        # Sub-buttons are created on first expansion (see _ensure_populated)
+        self._items = items
+        self._populated = False
+        # Natural height of the expanded container, measured on first expand
+        self._expanded_height = None
 
         self.container.setVisible(False)
         self.container.setMaximumHeight(0)
         self.main_layout.addWidget(self.container)
 
-    def _on_hover(self, entering):
-        self.header_widget.setStyleSheet(
-            "QWidget { background-color: #F1F5F9; border-radius: 6px; }"
-            if entering else
-            "QWidget { background: transparent; border-radius: 6px; }"
-        )
+        # Expand/collapse animation, built once and re-aimed on each toggle.
+        # Height alone reveals the items; an opacity effect would render the
+        # whole sub-menu offscreen on every frame.
+        self._h_anim = QPropertyAnimation(self.container, b"maximumHeight", self)
+        self._h_anim.finished.connect(self._on_height_anim_finished)
+
+    def _ensure_populated(self):
+        if self._populated:
+            return
+        self._populated = True
+        for item_text, page_id in self._items:
+            sub_btn = QPushButton(item_text)
+            sub_btn.setCursor(Qt.PointingHandCursor)
+            sub_btn.setFocusPolicy(Qt.NoFocus)
+            sub_btn.setObjectName("SidebarSubItem")
+            sub_btn.setProperty("page_id", page_id)
+            sub_btn.clicked.connect(self._on_sub_clicked)
+            self.sub_buttons.append(sub_btn)
+            self.container_layout.addWidget(sub_btn)
 
-    def _on_sub_clicked(self, button, callback):
-        self.sidebar_ref.clear_all_selections()
-        button.setStyleSheet(STYLE_ACTIVE)
-        callback()
+    @Slot()
+    def _on_sub_clicked(self):
+        # One shared slot for every sub-button; the page comes from the sender
+        button = self.sender()
+        self.sidebar_ref._activate_sub(button)
+        self.sidebar_ref.nav_callback(button.property("page_id"))
 
     def _update_chevron(self):
-        code = "fa5s.chevron-down" if self.is_expanded else "fa5s.chevron-right"
-        self.chevron_label.setPixmap(qta.icon(code, color="#94A3B8").pixmap(QSize(10, 10)))
+        pm = self._chevron_cache.get(self.is_expanded)
+        if pm is None:
+            code = "fa5s.chevron-down" if self.is_expanded else "fa5s.chevron-right"
+            pm = self._chevron_cache[self.is_expanded] = icon_pixmap(code, "#94A3B8", 10, 10)
+        self.chevron_label.setPixmap(pm)
 
     def toggle_expansion(self, event):
         if self.sidebar_ref.is_collapsed:
@@ -183,41 +330,43 @@ class CollapsibleMenu(QWidget):
             return
         self.is_expanded = not self.is_expanded
         self._update_chevron()
+        anim = self._h_anim
+        anim.stop()
+        if not ANIMATIONS_ENABLED:
+            if self.is_expanded:
+                self._ensure_populated()
+                self.container.setMaximumHeight(self._target_height())
+            else:
+                self.container.setMaximumHeight(0)
+            self.container.setVisible(self.is_expanded)
+            return
         if self.is_expanded:
+            self._ensure_populated()
             self.container.setVisible(True)
-            target_h = self.container_layout.sizeHint().height()
-            self._h_anim = QPropertyAnimation(self.container, b"maximumHeight")
-            self._h_anim.setDuration(250)
-            self._h_anim.setStartValue(0)
-            self._h_anim.setEndValue(target_h)
-            self._h_anim.setEasingCurve(QEasingCurve.OutCubic)
-            self._op_fx = QGraphicsOpacityEffect()
-            self.container.setGraphicsEffect(self._op_fx)
-            self._op_anim = QPropertyAnimation(self._op_fx, b"opacity")
-            self._op_anim.setDuration(250)
-            self._op_anim.setStartValue(0.0)
-            self._op_anim.setEndValue(1.0)
-            self._op_anim.setEasingCurve(QEasingCurve.OutCubic)
-            self._h_anim.start()
-            self._op_anim.start()
+            anim.setDuration(250)
+            anim.setStartValue(self.container.maximumHeight())
+            anim.setEndValue(self._target_height())
+            anim.setEasingCurve(QEasingCurve.OutCubic)
         else:
-            self._h_anim = QPropertyAnimation(self.container, b"maximumHeight")
-            self._h_anim.setDuration(200)
-            self._h_anim.setStartValue(self.container.height())
-            self._h_anim.setEndValue(0)
-            self._h_anim.setEasingCurve(QEasingCurve.InCubic)
-            if self.container.graphicsEffect():
-                self._op_anim = QPropertyAnimation(self.container.graphicsEffect(), b"opacity")
-                self._op_anim.setDuration(200)
-                self._op_anim.setStartValue(1.0)
-                self._op_anim.setEndValue(0.0)
-                self._op_anim.setEasingCurve(QEasingCurve.InCubic)
-                self._op_anim.start()
-            self._h_anim.finished.connect(lambda: self.container.setVisible(False))
-            self._h_anim.start()
+            anim.setDuration(200)
+            anim.setStartValue(self.container.height())
+            anim.setEndValue(0)
+            anim.setEasingCurve(QEasingCurve.InCubic)
+        anim.start()
+
+    def _target_height(self) -> int:
+        # The sub-items never change after population, so measure them once
+        if self._expanded_height is None:
+            self._expanded_height = self.container_layout.sizeHint().height()
+        return self._expanded_height
+
+    def _on_height_anim_finished(self):
+        if not self.is_expanded:
+            self.container.setVisible(False)
 
     def close_submenu(self):
         if self.is_expanded:
+            self._h_anim.stop()
             self.is_expanded = False
             self._update_chevron()
             self.container.setVisible(False)
@@ -236,92 +385,65 @@ class Sidebar(QFrame):
         self._logout_callback = logout_callback
         self.menus: list[CollapsibleMenu] = []
         self._icon_btns: list[QPushButton] = []
+        # Currently highlighted buttons, so clearing touches only these
+        self._active_sub: QPushButton | None = None
+        self._active_icon: QPushButton | None = None
         self.is_collapsed = False
         self.expanded_width         = 270
         self._default_expanded_width = 190  # minimum for drag resize
         self.collapsed_width         = 56
 
         self.setFixedWidth(self.expanded_width)
-        self.setStyleSheet("""
-            QFrame {
-                background-color: #E2E8F0;
-                border-right: 1px solid #CBD5E1;
-            }
-        """)
+        self.setStyleSheet(SIDEBAR_QSS)
 
         # Root: inner content + resize handle
-        root = QHBoxLayout(self)
-        root.setContentsMargins(0, 0, 0, 0)
-        root.setSpacing(0)
+        root = _hbox(self)
 
         self._inner = QWidget()
         self._inner.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self._inner.setStyleSheet("background: transparent;")
-        self.main_sidebar_layout = QVBoxLayout(self._inner)
-        self.main_sidebar_layout.setContentsMargins(0, 0, 0, 0)
-        self.main_sidebar_layout.setSpacing(0)
+        self._inner.setObjectName("SidebarPane")
+        self.main_sidebar_layout = _vbox(self._inner)
 
         # ── Toggle button (always visible) ───────────────────────────────────
         toggle_row = QWidget()
-        toggle_row.setStyleSheet("background: transparent;")
-        tr_layout = QHBoxLayout(toggle_row)
-        tr_layout.setContentsMargins(10, 14, 10, 14)
-        tr_layout.setSpacing(0)
+        tr_layout = _hbox(toggle_row, (10, 14, 10, 14))
+
+        # Both toggle icons built once; expand/collapse only swaps them
+        self._icon_bars = _icon("fa5s.bars", "#475569")
+        self._icon_chevron_right = _icon("fa5s.chevron-right", "#475569")
 
         self.toggle_btn = QPushButton()
-        self.toggle_btn.setIcon(qta.icon("fa5s.bars", color="#475569"))
+        self.toggle_btn.setIcon(self._icon_bars)
         self.toggle_btn.setIconSize(QSize(18, 18))
         self.toggle_btn.setFixedSize(36, 36)
         self.toggle_btn.setCursor(Qt.PointingHandCursor)
         self.toggle_btn.setFocusPolicy(Qt.NoFocus)
-        self.toggle_btn.setStyleSheet("""
-            QPushButton {
-                background: transparent; border: none;
-                border-radius: 8px; outline: none;
-            }
-            QPushButton:hover { background-color: #CBD5E1; }
-        """)
+        self.toggle_btn.setObjectName("SidebarToggle")
         self.toggle_btn.clicked.connect(self.toggle_sidebar)
         tr_layout.addWidget(self.toggle_btn, alignment=Qt.AlignLeft)
         self.main_sidebar_layout.addWidget(toggle_row)
 
         # ── Expanded content (scroll area) ────────────────────────────────────
         self._expanded_widget = QWidget()
-        self._expanded_widget.setStyleSheet("background: transparent;")
-        exp_vbox = QVBoxLayout(self._expanded_widget)
-        exp_vbox.setContentsMargins(0, 0, 0, 0)
-        exp_vbox.setSpacing(0)
+        exp_vbox = _vbox(self._expanded_widget)
 
         self.scroll = QScrollArea()
         self.scroll.setWidgetResizable(True)
         self.scroll.setFrameShape(QFrame.NoFrame)
         self.scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.scroll.setStyleSheet("""
-            QScrollArea { background: transparent; border: none; }
-            QScrollBar:vertical { background: transparent; width: 6px; margin: 0px; }
-            QScrollBar::handle:vertical { background: #D1D5DB; border-radius: 3px; min-height: 30px; }
-            QScrollBar::handle:vertical:hover { background: #9CA3AF; }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical { height: 0px; }
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical { background: none; }
-        """)
+        self.scroll.setObjectName("SidebarScroll")
 
         self.content_container = QWidget()
         self.content_container.setObjectName("content_container")
-        self.content_container.setStyleSheet("#content_container { background: #E2E8F0; }")
-        self.content_layout = QVBoxLayout(self.content_container)
-        self.content_layout.setContentsMargins(14, 10, 14, 20)
-        self.content_layout.setSpacing(3)
+        self.content_layout = _vbox(self.content_container, (14, 10, 14, 20), 3)
         self.scroll.setWidget(self.content_container)
         exp_vbox.addWidget(self.scroll)
         self.main_sidebar_layout.addWidget(self._expanded_widget)
 
         # ── Collapsed content (icon-only column) ──────────────────────────────
         self._collapsed_widget = QWidget()
-        self._collapsed_widget.setStyleSheet("background: transparent;")
         self._collapsed_widget.setVisible(False)
-        col_vbox = QVBoxLayout(self._collapsed_widget)
-        col_vbox.setContentsMargins(8, 8, 8, 8)
-        col_vbox.setSpacing(6)
+        col_vbox = _vbox(self._collapsed_widget, (8, 8, 8, 8), 6)
         col_vbox.setAlignment(Qt.AlignTop | Qt.AlignHCenter)
         self._col_vbox = col_vbox
         self.main_sidebar_layout.addWidget(self._collapsed_widget)
@@ -333,6 +455,11 @@ class Sidebar(QFrame):
         root.addWidget(self._inner)
         root.addWidget(_ResizeHandle(self))
 
+        # Width animation for expand/collapse, re-aimed on each toggle
+        self._width_anim = QPropertyAnimation(self, b"sidebarWidth", self)
+        self._width_anim.setDuration(280)
+        self._width_anim.setEasingCurve(QEasingCurve.InOutCubic)
+
         self._build_menus()
 
     # ── User panel ────────────────────────────────────────────────────────────
@@ -340,20 +467,12 @@ class Sidebar(QFrame):
     def _make_user_panel(self) -> QWidget:
         panel = QWidget()
         panel.setObjectName("user_panel")
-        panel.setStyleSheet("""
-            #user_panel { background-color: #E2E8F0; border-top: 1px solid #CBD5E1; }
-        """)
         # We'll use a stacked approach: one QWidget for expanded, one for collapsed
-        root_layout = QVBoxLayout(panel)
-        root_layout.setContentsMargins(0, 0, 0, 0)
-        root_layout.setSpacing(0)
+        root_layout = _vbox(panel)
 
         # ── Expanded row (horizontal) ─────────────────────────────────────────
         self._user_expanded = QWidget()
-        self._user_expanded.setStyleSheet("background:transparent;")
-        exp_row = QHBoxLayout(self._user_expanded)
-        exp_row.setContentsMargins(10, 12, 10, 12)
-        exp_row.setSpacing(0)
+        exp_row = _hbox(self._user_expanded, (10, 12, 10, 12))
 
         avatar_exp = self._make_avatar()
         display_name = self._current_user.get("description") or self._current_user.get("pk", "User")
@@ -362,19 +481,14 @@ class Sidebar(QFrame):
             f"{self._current_user.get('pk', '')}</span>"
         )
         self._user_info.setTextFormat(Qt.RichText)
-        self._user_info.setStyleSheet(
-            "font-size:12px; font-weight:600; color:#111827; background:transparent; border:none;"
-        )
+        self._user_info.setObjectName("SidebarUserInfo")
         self._exit_btn = QPushButton()
-        self._exit_btn.setIcon(qta.icon("fa5s.sign-out-alt", color="#9CA3AF"))
+        self._exit_btn.setIcon(_icon("fa5s.sign-out-alt", "#9CA3AF"))
         self._exit_btn.setIconSize(QSize(16, 16))
         self._exit_btn.setFixedSize(28, 28)
         self._exit_btn.setCursor(Qt.PointingHandCursor)
         self._exit_btn.setFocusPolicy(Qt.NoFocus)
-        self._exit_btn.setStyleSheet("""
-            QPushButton { background:transparent; border:none; border-radius:6px; outline:none; }
-            QPushButton:hover { background-color:#FEE2E2; }
-        """)
+        self._exit_btn.setObjectName("SidebarExit")
         exp_row.addWidget(avatar_exp, alignment=Qt.AlignVCenter)
         exp_row.addSpacing(10)
         exp_row.addWidget(self._user_info)
@@ -385,25 +499,19 @@ class Sidebar(QFrame):
 
         # ── Collapsed column (vertical, centered) ─────────────────────────────
         self._user_collapsed = QWidget()
-        self._user_collapsed.setStyleSheet("background:transparent;")
         self._user_collapsed.setVisible(False)
-        col_col = QVBoxLayout(self._user_collapsed)
-        col_col.setContentsMargins(8, 10, 8, 10)
-        col_col.setSpacing(6)
+        col_col = _vbox(self._user_collapsed, (8, 10, 8, 10), 6)
         col_col.setAlignment(Qt.AlignHCenter)
 
         avatar_col = self._make_avatar()
         exit_col = QPushButton()
-        exit_col.setIcon(qta.icon("fa5s.sign-out-alt", color="#9CA3AF"))
+        exit_col.setIcon(_icon("fa5s.sign-out-alt", "#9CA3AF"))
         exit_col.setIconSize(QSize(14, 14))
         exit_col.setFixedSize(32, 32)
         exit_col.setCursor(Qt.PointingHandCursor)
         exit_col.setFocusPolicy(Qt.NoFocus)
         exit_col.setToolTip("Sign out")
-        exit_col.setStyleSheet("""
-            QPushButton { background:transparent; border:none; border-radius:6px; outline:none; }
-            QPushButton:hover { background-color:#FEE2E2; }
-        """)
+        exit_col.setObjectName("SidebarExit")
         col_col.addWidget(avatar_col, alignment=Qt.AlignHCenter)
         col_col.addWidget(exit_col, alignment=Qt.AlignHCenter)
         if self._logout_callback:
@@ -413,19 +521,11 @@ class Sidebar(QFrame):
         root_layout.addWidget(self._user_collapsed)
         return panel
 
-    def _make_avatar(self) -> QWidget:
-        avatar = QWidget()
+    def _make_avatar(self) -> QLabel:
+        avatar = QLabel()
         avatar.setFixedSize(36, 36)
-        avatar.setStyleSheet(
-            "background-color:#EFF6FF; border:2px solid #DBEAFE; border-radius:18px;"
-        )
-        av = QHBoxLayout(avatar)
-        av.setContentsMargins(0, 0, 0, 0)
-        av.setAlignment(Qt.AlignCenter)
-        ic = QLabel()
-        ic.setStyleSheet("background:transparent; border:none;")
-        ic.setPixmap(qta.icon("fa5s.user", color="#2563EB").pixmap(QSize(16, 16)))
-        av.addWidget(ic)
+        avatar.setObjectName("SidebarAvatar")
+        avatar.setPixmap(_avatar_pixmap())
         return avatar
 
     # ── Build menus ───────────────────────────────────────────────────────────
@@ -433,33 +533,13 @@ class Sidebar(QFrame):
     def _build_menus(self):
         # Title
         title_w = QWidget()
-        title_w.setStyleSheet("background:transparent;")
-        tl = QVBoxLayout(title_w)
-        tl.setContentsMargins(12, 8, 12, 16)
+        tl = _vbox(title_w, (12, 8, 12, 16))
         lbl = QLabel("Menu")
-        lbl.setStyleSheet("font-size:17px; font-weight:700; color:#111827; background:transparent;")
+        lbl.setObjectName("SidebarTitle")
         tl.addWidget(lbl)
         self.content_layout.addWidget(title_w)
 
-        menu_defs = [
-            ("File",    "fa5s.folder",   {"Dashboard": lambda: self.nav_callback(0)}),
-            ("Master",  "fa5s.database", {
-                "Source Data Group":   lambda: self.nav_callback(2),
-                "Master Sticker":      lambda: self.nav_callback(3),
-                "Master Filter Type":  lambda: self.nav_callback(4),
-                "Master Brand":        lambda: self.nav_callback(5),
-                "Master Product Type": lambda: self.nav_callback(6),
-                "Master Item":         lambda: self.nav_callback(7),
-                "Master Brand Case":   lambda: self.nav_callback(8),
-            }),
-            ("Barcode", "fa5s.barcode",  {
-                "Barcode Design": lambda: self.nav_callback(9),
-                "Barcode Print":  lambda: self.nav_callback(10), 
-            }),
-            
-        ]
-
-        for title, icon, items in menu_defs:
+        for title, icon, items in MENU_SPEC:
             self.content_layout.addSpacing(2)
             menu = CollapsibleMenu(title, icon, items, self)
             self.content_layout.addWidget(menu)
@@ -467,23 +547,23 @@ class Sidebar(QFrame):
 
             # Collapsed icon button
             btn = QPushButton()
-            btn.setIcon(qta.icon(icon, color="#475569"))
+            btn.setIcon(_icon(icon, "#475569"))
             btn.setIconSize(QSize(20, 20))
             btn.setFixedSize(40, 40)
             btn.setCursor(Qt.PointingHandCursor)
             btn.setFocusPolicy(Qt.NoFocus)
             btn.setToolTip(title)
-            btn.setStyleSheet(ICON_BTN_STYLE.format(bg="transparent"))
-            btn.clicked.connect(
-                lambda chk=False, m=menu: self._on_collapsed_icon_click(m)
-            )
+            btn.setObjectName("SidebarIconBtn")
+            btn.clicked.connect(self._on_collapsed_icon_click)
             self._col_vbox.addWidget(btn, alignment=Qt.AlignHCenter)
             self._icon_btns.append(btn)
 
         self.content_layout.addStretch()
         self._col_vbox.addStretch()
 
-    def _on_collapsed_icon_click(self, menu: CollapsibleMenu):
+    @Slot()
+    def _on_collapsed_icon_click(self):
+        menu = self.menus[self._icon_btns.index(self.sender())]
         self._apply_expanded_ui(animate=True)
         if not menu.is_expanded:
             menu.toggle_expansion(None)
@@ -492,7 +572,7 @@ class Sidebar(QFrame):
 
     def _apply_expanded_ui(self, animate=False, set_width=True):
         self.is_collapsed = False
-        self.toggle_btn.setIcon(qta.icon("fa5s.bars", color="#475569"))
+        self.toggle_btn.setIcon(self._icon_bars)
         self._collapsed_widget.setVisible(False)
         self._expanded_widget.setVisible(True)
         self._user_expanded.setVisible(True)
@@ -506,7 +586,7 @@ class Sidebar(QFrame):
 
     def _apply_collapsed_ui(self, animate=False):
         self.is_collapsed = True
-        self.toggle_btn.setIcon(qta.icon("fa5s.chevron-right", color="#475569"))
+        self.toggle_btn.setIcon(self._icon_chevron_right)
         self._expanded_widget.setVisible(False)
         self._collapsed_widget.setVisible(True)
         self._user_expanded.setVisible(False)
@@ -526,61 +606,57 @@ class Sidebar(QFrame):
             self._apply_collapsed_ui(animate=True)
 
     def _animate_width(self, target: int):
-        # Reset constraints so animation isn't blocked by a previous min/max
-        self.setMinimumWidth(0)
-        self.setMaximumWidth(16777215)
-        for prop in (b"minimumWidth", b"maximumWidth"):
-            anim = QPropertyAnimation(self, prop)
-            anim.setDuration(280)
-            anim.setStartValue(self.width())
-            anim.setEndValue(target)
-            anim.setEasingCurve(QEasingCurve.InOutCubic)
-            anim.start()
-            setattr(self, f"_anim_{prop.decode()}", anim)  # keep reference
+        if not ANIMATIONS_ENABLED:
+            self.setFixedWidth(target)
+            return
+        anim = self._width_anim
+        anim.stop()
+        anim.setStartValue(self.width())
+        anim.setEndValue(target)
+        anim.start()
+
+    def _get_sidebar_width(self) -> int:
+        return self.width()
+
+    def _set_sidebar_width(self, value: int):
+        # One fixed-width update per frame instead of separate min and max setters
+        self.setFixedWidth(value)
+
+    sidebarWidth = Property(int, _get_sidebar_width, _set_sidebar_width)
 
     # ── Selection ─────────────────────────────────────────────────────────────
 
     def clear_all_selections(self):
-        for menu in self.menus:
-            for btn in menu.sub_buttons:
-                btn.setStyleSheet(STYLE_NORMAL)
-        for btn in self._icon_btns:
-            btn.setStyleSheet(ICON_BTN_STYLE.format(bg="transparent"))
+        for btn in (self._active_sub, self._active_icon):
+            if btn is not None:
+                _set_active(btn, False)
+        self._active_sub = self._active_icon = None
+
+    def _activate_sub(self, button: QPushButton):
+        self.clear_all_selections()
+        _set_active(button, True)
+        self._active_sub = button
 
     def set_active(self, page_id: int):
         self.clear_all_selections()
-        mapping = {
-            0: ("Dashboard",        0),
-            2: ("Source Data Group",1),
-            3: ("Master Sticker",   1),
-            4: ("Master Filter Type",1),
-            5: ("Master Brand",     1),
-            6: ("Master Product Type",1),
-            7: ("Master Item",      1),
-            8: ("Master Brand Case",1),
-            9: ("Barcode Design",   2),
-            10: ("Barcode Print",   2)
-        }
-        entry = mapping.get(page_id)
+        entry = _PAGE_ITEMS.get(page_id)
         if not entry:
             return
         target_text, menu_idx = entry
         if menu_idx < len(self._icon_btns):
-            self._icon_btns[menu_idx].setStyleSheet(
-                ICON_BTN_STYLE.format(bg="#EFF6FF")
-            )
-        for menu in self.menus:
-            for btn in menu.sub_buttons:
-                if btn.text() == target_text:
-                    btn.setStyleSheet(STYLE_ACTIVE)
-                    if not menu.is_expanded and not self.is_collapsed:
-                        menu.toggle_expansion(None)
-                    return
+            self._active_icon = self._icon_btns[menu_idx]
+            _set_active(self._active_icon, True)
+        menu = self.menus[menu_idx]
+        menu._ensure_populated()
+        for btn in menu.sub_buttons:
+            if btn.text() == target_text:
+                _set_active(btn, True)
+                self._active_sub = btn
+                if not menu.is_expanded and not self.is_collapsed:
+                    menu.toggle_expansion(None)
+                return
 
     def create_label(self, text):
         lbl = QLabel(text)
-        lbl.setStyleSheet(
-            "font-size:10px; color:#9CA3AF; font-weight:700; "
-            "letter-spacing:0.8px; padding:6px 12px 4px 12px; background:transparent;"
-        )
+        lbl.setObjectName("SidebarSectionLabel")
         return lbl
\ No newline at end of file
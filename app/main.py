@@ -1,18 +1,24 @@
 import sys
+from collections.abc import Mapping
+from functools import partial
 from pathlib import Path
+from types import MappingProxyType
+from typing import NamedTuple
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "server"))
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QHBoxLayout, QVBoxLayout,
     QTabWidget, QTabBar, QWidget, QLabel, QPushButton,
     QSizePolicy, QToolTip, QMenu, QFrame, QAbstractButton,
-    QStackedWidget
 )
-from PySide6.QtCore import Qt, Signal, QSize, QPoint, QRect, QPropertyAnimation, QEasingCurve
-from PySide6.QtGui import QIcon, QAction, QFont, QColor, QPalette, QCursor, QPainter, QPen, QBrush
+from PySide6.QtCore import Qt, Signal, Slot, QSize, QPoint, QRect, QPropertyAnimation, QEasingCurve, QTimer
+from PySide6.QtGui import (
+    QIcon, QAction, QFont, QColor, QPalette, QCursor, QPainter, QPen, QBrush, QPixmap, QPixmapCache,
+    QShortcut, QKeySequence,
+)
 
 # ── Importing your custom components ─────────────────────────────────────────
-from layout.sidebar import Sidebar
+from layout.sidebar import Sidebar, preload_icons as preload_sidebar_icons
 from pages.master_item import MasterItemPage
 from pages.source_data_group import SourceDataPage
 from pages.sticker_size import StickerSizePage
@@ -23,22 +29,34 @@ from pages.brand_case import BrandCasePage
 from pages.barcode_list import BarcodeListPage
 from pages.barcode_print import BarcodePrintPage
 from layout.login_window import LoginWindow
+from components.search_bar import preload_icons
 
 # ─────────────────────────────────────────────────────────────────────────────
 # PAGE REGISTRY
 # ─────────────────────────────────────────────────────────────────────────────
-PAGE_REGISTRY: dict[int, dict] = {
-    0:  {"title": "Dashboard",      "class": None,              "icon": "🏠"},
-    1:  {"title": "Master Item",    "class": MasterItemPage,    "icon": "📦"},
-    2:  {"title": "Source Data",    "class": SourceDataPage,    "icon": "🗄️"},
-    3:  {"title": "Sticker Size",   "class": StickerSizePage,   "icon": "🏷️"},
-    4:  {"title": "Filter Type",    "class": FilterTypePage,    "icon": "🔽"},
-    5:  {"title": "Brand",          "class": BrandPage,         "icon": "🏢"},
-    6:  {"title": "Product Type",   "class": ProductTypePage,   "icon": "🗂️"},
-    7:  {"title": "Item Master",    "class": MasterItemPage,    "icon": "📋"},
-    8:  {"title": "Brand Case",     "class": BrandCasePage,     "icon": "🗃️"},
-    9:  {"title": "Barcode Design", "class": BarcodeListPage,   "icon": "📊"},
-    10: {"title": "Barcode Print",  "class": BarcodePrintPage,  "icon": "🖨️"},
+class PageEntry(NamedTuple):
+    title: str
+    cls: type[QWidget] | None
+    icon: str
+
+
+PAGE_REGISTRY: Mapping[int, PageEntry] = MappingProxyType({
+    0:  PageEntry("Dashboard",      None,              "🏠"),
+    1:  PageEntry("Master Item",    MasterItemPage,    "📦"),
+    2:  PageEntry("Source Data",    SourceDataPage,    "🗄️"),
+    3:  PageEntry("Sticker Size",   StickerSizePage,   "🏷️"),
+    4:  PageEntry("Filter Type",    FilterTypePage,    "🔽"),
+    5:  PageEntry("Brand",          BrandPage,         "🏢"),
+    6:  PageEntry("Product Type",   ProductTypePage,   "🗂️"),
+    7:  PageEntry("Item Master",    MasterItemPage,    "📋"),
+    8:  PageEntry("Brand Case",     BrandCasePage,     "🗃️"),
+    9:  PageEntry("Barcode Design", BarcodeListPage,   "📊"),
+    10: PageEntry("Barcode Print",  BarcodePrintPage,  "🖨️"),
+})
+
+# Tab title -> page id, so tab switches don't walk the registry
+TITLE_TO_PAGE_ID: dict[str, int] = {
+    entry.title: page_id for page_id, entry in PAGE_REGISTRY.items()
 }
 
 
@@ -76,23 +94,43 @@ class ChromeCloseButton(QAbstractButton):
         self.update()
         super().mouseReleaseEvent(event)
 
-    def paintEvent(self, event):
-        p = QPainter(self)
+    def _state(self) -> int:
+        if self._pressed:
+            return 2
+        return 1 if self._hovered else 0
+
+    def _face(self) -> QPixmap:
+        # Faces are shared app-wide through QPixmapCache; every tab's button
+        # blits the same pixmap instead of re-rasterising the glyph
+        state = self._state()
+        w, h, dpr = self.width(), self.height(), self.devicePixelRatioF()
+        key = f"tab-close|{state}|{w}x{h}|{dpr}"
+        pm = QPixmapCache.find(key)
+        if pm is None:
+            pm = self._render_face(w, h, dpr, state)
+            QPixmapCache.insert(key, pm)
+        return pm
+
+    @staticmethod
+    def _render_face(w: int, h: int, dpr: float, state: int) -> QPixmap:
+        pm = QPixmap(int(w * dpr), int(h * dpr))
+        pm.setDevicePixelRatio(dpr)
+        pm.fill(Qt.transparent)
+
+        p = QPainter(pm)
         p.setRenderHint(QPainter.Antialiasing)
-
-        w, h = self.width(), self.height()
         cx, cy = w / 2.0, h / 2.0
 
-        if self._pressed:
+        if state == 2:
             p.setBrush(QBrush(QColor("#B0B5BE")))
             p.setPen(Qt.NoPen)
             p.drawEllipse(QRect(1, 1, w - 2, h - 2))
-        elif self._hovered:
+        elif state == 1:
             p.setBrush(QBrush(QColor("#DADDE3")))
             p.setPen(Qt.NoPen)
             p.drawEllipse(QRect(1, 1, w - 2, h - 2))
 
-        cross_color = QColor("#3C4048") if (self._hovered or self._pressed) else QColor("#9CA3AF")
+        cross_color = QColor("#3C4048") if state else QColor("#9CA3AF")
         pen = QPen(cross_color, 1.6, Qt.SolidLine, Qt.RoundCap)
         p.setPen(pen)
         offset = 3.8
@@ -105,6 +143,12 @@ class ChromeCloseButton(QAbstractButton):
             QPoint(int(cx - offset), int(cy + offset)),
         )
         p.end()
+        return pm
+
+    def paintEvent(self, event):
+        p = QPainter(self)
+        p.drawPixmap(0, 0, self._face())
+        p.end()
 
     def sizeHint(self):
         return QSize(16, 16)
@@ -113,6 +157,19 @@ class ChromeCloseButton(QAbstractButton):
 # ─────────────────────────────────────────────────────────────────────────────
 # CUSTOM TAB BAR
 # ─────────────────────────────────────────────────────────────────────────────
+_TAB_MENU_QSS = """
+    QMenu {
+        background: #1E293B; color: #E2E8F0;
+        border: 1px solid #334155; border-radius: 6px;
+        padding: 4px; font-size: 13px;
+    }
+    QMenu::item { padding: 7px 20px 7px 12px; border-radius: 4px; }
+    QMenu::item:selected { background: #3B82F6; color: white; }
+    QMenu::item:disabled { color: #475569; }
+    QMenu::separator { height: 1px; background: #334155; margin: 4px 8px; }
+"""
+
+
 class AppTabBar(QTabBar):
     close_others_requested = Signal(int)
     close_right_requested = Signal(int)
@@ -124,6 +181,8 @@ class AppTabBar(QTabBar):
         self.setUsesScrollButtons(True)
         self.setElideMode(Qt.ElideRight)
         self.setExpanding(False)
+        self._ctx_menu: QMenu | None = None
+        self._ctx_index = -1
 
     def tabInserted(self, index: int):
         super().tabInserted(index)
@@ -132,61 +191,98 @@ class AppTabBar(QTabBar):
 
     def _install_close_button(self, index: int):
         btn = ChromeCloseButton(self)
-        btn.clicked.connect(lambda _=False, b=btn: self.tabCloseRequested.emit(self._index_of_button(b)))
+        btn.clicked.connect(self._on_close_clicked)
         self.setTabButton(index, QTabBar.ButtonPosition.RightSide, btn)
 
-    def _index_of_button(self, btn: ChromeCloseButton) -> int:
-        for i in range(self.count()):
-            if self.tabButton(i, QTabBar.ButtonPosition.RightSide) is btn:
-                return i
-        return -1
+    @Slot()
+    def _on_close_clicked(self):
+        # The button sits inside its tab, so its position names the tab
+        # even after moves and closes have shifted the indices.
+        self.tabCloseRequested.emit(self.tabAt(self.sender().geometry().center()))
 
     def contextMenuEvent(self, event):
         index = self.tabAt(event.pos())
         if index < 0:
             return
 
+        if self._ctx_menu is None:
+            self._build_context_menu()
+        self._ctx_index = index
+        self._act_close.setEnabled(self.tabData(index) != "pinned")
+        self._ctx_menu.exec(event.globalPos())
+
+    def _build_context_menu(self):
+        # Built on the first right-click and reused; the actions act on
+        # whichever tab _ctx_index names when the menu opens.
         menu = QMenu(self)
-        menu.setStyleSheet("""
-            QMenu {
-                background: #1E293B; color: #E2E8F0;
-                border: 1px solid #334155; border-radius: 6px;
-                padding: 4px; font-size: 13px;
-            }
-            QMenu::item { padding: 7px 20px 7px 12px; border-radius: 4px; }
-            QMenu::item:selected { background: #3B82F6; color: white; }
-            QMenu::item:disabled { color: #475569; }
-            QMenu::separator { height: 1px; background: #334155; margin: 4px 8px; }
-        """)
-
-        is_pinned = self.tabData(index) == "pinned"
-
-        act_close = QAction("Close Tab", self)
-        act_close.setEnabled(not is_pinned)
-        act_close.triggered.connect(lambda: self.tabCloseRequested.emit(index))
+        menu.setStyleSheet(_TAB_MENU_QSS)
+
+        self._act_close = QAction("Close Tab", self)
+        self._act_close.triggered.connect(lambda: self.tabCloseRequested.emit(self._ctx_index))
 
         act_close_others = QAction("Close Other Tabs", self)
-        act_close_others.triggered.connect(lambda: self.close_others_requested.emit(index))
+        act_close_others.triggered.connect(lambda: self.close_others_requested.emit(self._ctx_index))
 
         act_close_right = QAction("Close Tabs to the Right", self)
-        act_close_right.triggered.connect(lambda: self.close_right_requested.emit(index))
+        act_close_right.triggered.connect(lambda: self.close_right_requested.emit(self._ctx_index))
 
-        menu.addAction(act_close)
+        menu.addAction(self._act_close)
         menu.addSeparator()
         menu.addAction(act_close_others)
         menu.addAction(act_close_right)
-        menu.exec(event.globalPos())
+        self._ctx_menu = menu
 
-    def mouseMoveEvent(self, event):
-        current = self.currentIndex()
-        if self.tabData(current) == "pinned":
-            return
-        super().mouseMoveEvent(event)
+    # Pinned tabs can't be dragged: decide once per press instead of
+    # filtering every motion event of the drag.
+    def mousePressEvent(self, event):
+        if self.tabData(self.tabAt(event.pos())) == "pinned":
+            self.setMovable(False)
+        super().mousePressEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        super().mouseReleaseEvent(event)
+        if not self.isMovable():
+            self.setMovable(True)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # CUSTOM TAB WIDGET
 # ─────────────────────────────────────────────────────────────────────────────
+_TAB_WIDGET_QSS = """
+    QTabWidget::pane {
+        border: none;
+        border-top: 1px solid #E2E8F0;
+        background: #F8FAFC;
+    }
+    QTabWidget::tab-bar { alignment: left; }
+    QTabBar { background: #F1F5F9; border-bottom: 1px solid #E2E8F0; }
+    QTabBar::tab {
+        background: transparent; color: #64748B;
+        padding: 9px 36px 9px 14px;
+        border: none; border-right: 1px solid #E2E8F0;
+        min-width: 110px; max-width: 200px;
+        font-size: 13px; font-weight: 500;
+    }
+    QTabBar::tab:first { border-left: 1px solid #E2E8F0; }
+    QTabBar::tab:selected {
+        background: #FFFFFF; color: #1E293B;
+        font-weight: 600; border-bottom: 2px solid #3B82F6;
+    }
+    QTabBar::tab:hover:!selected { background: #E9EEF5; color: #334155; }
+    QTabBar::close-button {
+        subcontrol-position: right center;
+        subcontrol-origin: padding;
+        width: 16px; height: 16px; margin-right: 4px;
+    }
+    QTabBar::scroller { width: 28px; }
+    QTabBar QToolButton {
+        background: #E2E8F0; border: 1px solid #CBD5E1;
+        border-radius: 4px; padding: 2px;
+    }
+    QTabBar QToolButton:hover { background: #CBD5E1; }
+"""
+
+
 class AppTabWidget(QTabWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -201,42 +297,7 @@ class AppTabWidget(QTabWidget):
         self._tab_bar.close_others_requested.connect(self._close_others)
         self._tab_bar.close_right_requested.connect(self._close_right)
 
-        self.setStyleSheet(self._stylesheet())
-
-    def _stylesheet(self):
-        return """
-            QTabWidget::pane {
-                border: none;
-                border-top: 1px solid #E2E8F0;
-                background: #F8FAFC;
-            }
-            QTabWidget::tab-bar { alignment: left; }
-            QTabBar { background: #F1F5F9; border-bottom: 1px solid #E2E8F0; }
-            QTabBar::tab {
-                background: transparent; color: #64748B;
-                padding: 9px 36px 9px 14px;
-                border: none; border-right: 1px solid #E2E8F0;
-                min-width: 110px; max-width: 200px;
-                font-size: 13px; font-weight: 500;
-            }
-            QTabBar::tab:first { border-left: 1px solid #E2E8F0; }
-            QTabBar::tab:selected {
-                background: #FFFFFF; color: #1E293B;
-                font-weight: 600; border-bottom: 2px solid #3B82F6;
-            }
-            QTabBar::tab:hover:!selected { background: #E9EEF5; color: #334155; }
-            QTabBar::close-button {
-                subcontrol-position: right center;
-                subcontrol-origin: padding;
-                width: 16px; height: 16px; margin-right: 4px;
-            }
-            QTabBar::scroller { width: 28px; }
-            QTabBar QToolButton {
-                background: #E2E8F0; border: 1px solid #CBD5E1;
-                border-radius: 4px; padding: 2px;
-            }
-            QTabBar QToolButton:hover { background: #CBD5E1; }
-        """
+        self.setStyleSheet(_TAB_WIDGET_QSS)
 
     def add_pinned_tab(self, widget: QWidget, title: str) -> int:
         index = self.addTab(widget, title)
@@ -251,16 +312,32 @@ class AppTabWidget(QTabWidget):
             i for i in range(self.count())
             if i != keep_index and self.tabBar().tabData(i) != "pinned"
         ]
-        for i in reversed(indices_to_remove):
-            self.removeTab(i)
+        self._remove_tabs(indices_to_remove)
 
     def _close_right(self, from_index: int):
         indices_to_remove = [
             i for i in range(from_index + 1, self.count())
             if self.tabBar().tabData(i) != "pinned"
         ]
-        for i in reversed(indices_to_remove):
-            self.removeTab(i)
+        self._remove_tabs(indices_to_remove)
+
+    def _remove_tabs(self, indices: list[int]):
+        """Remove *indices* (ascending) with one repaint and one currentChanged."""
+        if not indices:
+            return
+        before = (self.currentIndex(), self.currentWidget())
+        self.setUpdatesEnabled(False)
+        # Block only the tab widget's own signals: its stack follows the
+        # tab bar's currentChanged, which must keep flowing.
+        was_blocked = self.blockSignals(True)
+        try:
+            for i in reversed(indices):
+                self.removeTab(i)
+        finally:
+            self.blockSignals(was_blocked)
+            self.setUpdatesEnabled(True)
+        if (self.currentIndex(), self.currentWidget()) != before:
+            self.currentChanged.emit(self.currentIndex())
 
     def find_tab_by_title(self, title: str) -> int | None:
         for i in range(self.count()):
@@ -277,23 +354,27 @@ def build_page(page_id: int) -> QWidget:
     if entry is None:
         return _placeholder_page(f"Unknown page (id={page_id})")
 
-    PageClass = entry.get("class")
+    PageClass = entry.cls
     if PageClass is None:
-        return _placeholder_page(entry["title"])
+        return _placeholder_page(entry.title)
 
     try:
         return PageClass()
     except Exception as exc:
-        return _placeholder_page(f"Failed to load '{entry['title']}'\n\n{exc}", error=True)
+        return _placeholder_page(f"Failed to load '{entry.title}'\n\n{exc}", error=True)
+
+
+_PLACEHOLDER_QSS = "font-size: 20px; color: #94A3B8; background: #F8FAFC; font-weight: 500;"
+_PLACEHOLDER_ERROR_QSS = "font-size: 20px; color: #EF4444; background: #F8FAFC; font-weight: 500;"
 
 
 def _placeholder_page(title: str, error: bool = False) -> QLabel:
     label = QLabel(f"{'⚠ ' if error else ''}  {title}")
     label.setAlignment(Qt.AlignCenter)
-    color = "#EF4444" if error else "#94A3B8"
-    label.setStyleSheet(
-        f"font-size: 20px; color: {color}; background: #F8FAFC; font-weight: 500;"
-    )
+    label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+    label.setStyleSheet(_PLACEHOLDER_ERROR_QSS if error else _PLACEHOLDER_QSS)
+    # A failed load should be retried next time, not served from the page cache
+    label._rebuild_on_open = error
     return label
 
 
@@ -321,18 +402,25 @@ class Dashboard(QMainWindow):
             logout_callback=self._on_logout,
         )
 
-        self._dashboard_widget = build_page(0)
+        # Pages built so far, keyed by page id; closing a tab keeps its page
+        # here so reopening it re-adds the same widget instead of rebuilding
+        self._page_cache: dict[int, QWidget] = {}
         self._tabs = AppTabWidget()
         self._tabs.tabCloseRequested.connect(self._on_tab_close_requested)
+        # The dashboard is a pinned first tab, so there is always a tab open
+        self._tabs.add_pinned_tab(build_page(0), PAGE_REGISTRY[0].title)
         self._tabs.currentChanged.connect(self._on_tab_changed)
 
-        self._stack = QStackedWidget()
-        self._stack.addWidget(self._dashboard_widget)
-        self._stack.addWidget(self._tabs)
-        self._stack.setCurrentIndex(0)
+        # Coalesces a burst of tab switches (held Ctrl+Tab) into one sidebar update
+        self._sidebar_sync_timer = QTimer(self)
+        self._sidebar_sync_timer.setSingleShot(True)
+        self._sidebar_sync_timer.setInterval(0)
+        self._sidebar_sync_timer.timeout.connect(self._sync_sidebar)
 
         root.addWidget(self._sidebar)
-        root.addWidget(self._stack, stretch=1)
+        root.addWidget(self._tabs, stretch=1)
+
+        self._install_shortcuts()
 
     # ── Logout ─────────────────────────────────────────────────────────────
     def _on_logout(self):
@@ -345,64 +433,65 @@ class Dashboard(QMainWindow):
         if entry is None:
             return
 
-        title = entry["title"]
-
-        if page_id == 0:
-            self._stack.setCurrentWidget(self._dashboard_widget)
-            self._sidebar.set_active(0)
-            return
+        title = entry.title
 
         existing = self._tabs.find_tab_by_title(title)
         if existing is not None:
-            self._stack.setCurrentWidget(self._tabs)
             self._tabs.setCurrentIndex(existing)
             self._sidebar.set_active(page_id)
             return
 
-        page_widget = build_page(page_id)
+        page_widget = self._open_page(page_id)
         idx = self._tabs.addTab(page_widget, title)
-        self._stack.setCurrentWidget(self._tabs)
         self._tabs.setCurrentIndex(idx)
         self._sidebar.set_active(page_id)
 
+    def _open_page(self, page_id: int) -> QWidget:
+        page_widget = self._page_cache.get(page_id)
+        if page_widget is None:
+            page_widget = build_page(page_id)
+            if not getattr(page_widget, "_rebuild_on_open", False):
+                self._page_cache[page_id] = page_widget
+        elif hasattr(page_widget, "load_data"):
+            # Reopened from the cache: keep the widgets, refresh the rows
+            page_widget.load_data()
+        return page_widget
+
     def _on_tab_changed(self, index: int):
-        if self._tabs.count() == 0:
-            self._stack.setCurrentWidget(self._dashboard_widget)
-            self._sidebar.set_active(0)
-        else:
-            title = self._tabs.tabText(index)
-            for pid, entry in PAGE_REGISTRY.items():
-                if entry["title"] == title:
-                    self._sidebar.set_active(pid)
-                    break
+        self._sidebar_sync_timer.start()
+
+    def _sync_sidebar(self):
+        pid = TITLE_TO_PAGE_ID.get(self._tabs.tabText(self._tabs.currentIndex()))
+        if pid is not None:
+            self._sidebar.set_active(pid)
 
     def _on_tab_close_requested(self, index: int):
+        if self._tabs.tabBar().tabData(index) == "pinned":
+            return
         self._tabs.removeTab(index)
-        if self._tabs.count() == 0:
-            self._stack.setCurrentWidget(self._dashboard_widget)
 
     # ── Keyboard shortcuts ─────────────────────────────────────────────────
-    def keyPressEvent(self, event):
-        key = event.key()
-        modifiers = event.modifiers()
-
-        if modifiers == Qt.ControlModifier and key == Qt.Key_W:
-            if self._stack.currentWidget() is self._tabs and self._tabs.count() > 0:
-                self._on_tab_close_requested(self._tabs.currentIndex())
-
-        elif self._stack.currentWidget() is self._tabs and self._tabs.count() > 0:
-            if modifiers == Qt.ControlModifier and key == Qt.Key_Tab:
-                count = self._tabs.count()
-                self._tabs.setCurrentIndex((self._tabs.currentIndex() + 1) % count)
-            elif modifiers == (Qt.ControlModifier | Qt.ShiftModifier) and key == Qt.Key_Tab:
-                count = self._tabs.count()
-                self._tabs.setCurrentIndex((self._tabs.currentIndex() - 1) % count)
-            elif modifiers == Qt.ControlModifier and Qt.Key_1 <= key <= Qt.Key_9:
-                target = key - Qt.Key_1
-                if target < self._tabs.count():
-                    self._tabs.setCurrentIndex(target)
-        else:
-            super().keyPressEvent(event)
+    def _install_shortcuts(self):
+        # Registered once with Qt's shortcut map; unrelated key presses never
+        # reach Python.
+        bindings = [
+            ("Ctrl+W", self._close_current_tab),
+            ("Ctrl+Tab", partial(self._cycle_tab, 1)),
+            ("Ctrl+Shift+Tab", partial(self._cycle_tab, -1)),
+        ]
+        bindings += [(f"Ctrl+{n}", partial(self._goto_tab, n - 1)) for n in range(1, 10)]
+        for keys, slot in bindings:
+            QShortcut(QKeySequence(keys), self, slot)
+
+    def _close_current_tab(self):
+        self._on_tab_close_requested(self._tabs.currentIndex())
+
+    def _cycle_tab(self, step: int):
+        self._tabs.setCurrentIndex((self._tabs.currentIndex() + step) % self._tabs.count())
+
+    def _goto_tab(self, target: int):
+        if target < self._tabs.count():
+            self._tabs.setCurrentIndex(target)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -455,4 +544,8 @@ if __name__ == "__main__":
     """)
 
     _launch_login()
+    # Resolve icons after the login window paints, not mid-construction; the
+    # first call also loads the qtawesome font the dashboard will need.
+    QTimer.singleShot(0, preload_icons)
+    QTimer.singleShot(0, preload_sidebar_icons)
     sys.exit(app.exec())
\ No newline at end of file
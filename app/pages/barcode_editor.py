@@ -13,10 +13,11 @@ from PySide6.QtWidgets import (
     QSizePolicy, QStackedWidget, QPushButton, QLineEdit,
     QStyledItemDelegate, QStyle, QSplitter,
 )
-from PySide6.QtCore import Qt, QPointF, QRectF, QRect, QSize, QEvent, Signal
+from PySide6.QtCore import Qt, QRectF, QRect, QLineF, QSize, QEvent, Signal
 from PySide6.QtGui import QColor, QPen, QBrush, QPainter, QFont, QCursor, QShortcut, QKeySequence, QFontMetrics
 
 from components.standard_button import StandardButton
+from components.icons import icon_pixmap
 
 from components.barcode_editor.utils import (
     COLORS, MODERN_SCROLLBAR_STYLE, TAB_ACTIVE_STYLE, TAB_INACTIVE_STYLE,
@@ -89,9 +90,41 @@ class ComponentItemDelegate(QStyledItemDelegate):
     # Layout constants for row geometry
     ROW_H = 38; ACCENT_W = 3; CHIP_SIZE = 24; PAD = 8; TRASH_SIZE = 18
 
+    # Colours parsed once; paint() runs for every visible row on each hover
+    _BG_SELECTED = QColor("#EEF2FF"); _BG_HOVER = QColor("#F8FAFC"); _BG = QColor("#FFFFFF")
+    _TRASH_BG = QColor("#FEE2E2"); _OUTLINE = QColor("#6366F1")
+    _TEXT_SELECTED = QColor("#1E293B"); _TEXT = QColor("#334155"); _TEXT_MUTE = QColor("#94A3B8")
+    # Per-type accent / chip colours keyed by (hex, alpha), filled on first use
+    _TYPE_COLORS: dict[tuple[str, int], QColor] = {}
+
+    @classmethod
+    def _type_color(cls, hex_color: str, alpha: int = 255) -> QColor:
+        key = (hex_color, alpha)
+        color = cls._TYPE_COLORS.get(key)
+        if color is None:
+            color = cls._TYPE_COLORS[key] = QColor(hex_color)
+            color.setAlpha(alpha)
+        return color
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Fonts and metrics reused by every paint() call
+        self._type_font = QFont(); self._type_font.setPointSize(9); self._type_font.setWeight(QFont.DemiBold)
+        self._value_font = QFont(); self._value_font.setPointSize(8)
+        self._type_fm = QFontMetrics(self._type_font)
+        self._value_fm = QFontMetrics(self._value_font)
+
     def sizeHint(self, option, index):
         return QSize(0, self.ROW_H)
 
+    def _trash_rect(self, r: QRect) -> QRect:
+        """Trash button inside the row's card rect *r*."""
+        return QRect(
+            r.right() - self.TRASH_SIZE - self.PAD,
+            r.top() + (r.height() - self.TRASH_SIZE) // 2,
+            self.TRASH_SIZE, self.TRASH_SIZE,
+        )
+
     def paint(self, painter, option, index):
         painter.save()
         painter.setRenderHint(QPainter.Antialiasing)
@@ -104,42 +137,36 @@ class ComponentItemDelegate(QStyledItemDelegate):
 
         r = option.rect.adjusted(4, 2, -4, -2)
 
-        bg = (QColor("#EEF2FF") if selected
-              else QColor("#F8FAFC") if hovered
-              else QColor("#FFFFFF"))
+        bg = (self._BG_SELECTED if selected
+              else self._BG_HOVER if hovered
+              else self._BG)
         painter.setPen(Qt.NoPen)
         painter.setBrush(QBrush(bg))
         painter.drawRoundedRect(r, 6, 6)
 
         accent_rect = QRect(r.left(), r.top() + 6, self.ACCENT_W, r.height() - 12)
-        painter.setBrush(QBrush(QColor(accent)))
+        painter.setBrush(QBrush(self._type_color(accent)))
         painter.drawRoundedRect(accent_rect, 2, 2)
 
         chip_x = r.left() + self.ACCENT_W + self.PAD
         chip_y = r.top() + (r.height() - self.CHIP_SIZE) // 2
         chip_r = QRect(chip_x, chip_y, self.CHIP_SIZE, self.CHIP_SIZE)
-        chip_bg = QColor(badge_bg)
-        chip_bg.setAlpha(40 if not selected else 60)
-        painter.setBrush(QBrush(chip_bg))
+        painter.setBrush(QBrush(self._type_color(badge_bg, 60 if selected else 40)))
         painter.drawRoundedRect(chip_r, 5, 5)
 
-        px = qta.icon(icon_name, color=badge_bg).pixmap(13, 13)
+        px = icon_pixmap(icon_name, badge_bg, 13, 13)
         painter.drawPixmap(chip_x + (self.CHIP_SIZE - 13) // 2, chip_y + (self.CHIP_SIZE - 13) // 2, px)
 
-        trash_x = r.right() - self.TRASH_SIZE - self.PAD
-        trash_y = r.top() + (r.height() - self.TRASH_SIZE) // 2
-        trash_r = QRect(trash_x, trash_y, self.TRASH_SIZE, self.TRASH_SIZE)
-
-        index.model().setData(index, trash_r, Qt.UserRole + 1)
+        trash_r = self._trash_rect(r)
+        trash_x, trash_y = trash_r.x(), trash_r.y()
 
         if hovered or selected:
-            painter.setBrush(QBrush(QColor("#FEE2E2")))
+            painter.setBrush(QBrush(self._TRASH_BG))
             painter.drawRoundedRect(trash_r, 4, 4)
 
-        trash_px = qta.icon(
-            "fa5s.trash-alt",
-            color="#EF4444" if (hovered or selected) else "#CBD5E1",
-        ).pixmap(11, 11)
+        trash_px = icon_pixmap(
+            "fa5s.trash-alt", "#EF4444" if (hovered or selected) else "#CBD5E1", 11, 11,
+        )
         painter.drawPixmap(trash_x + (self.TRASH_SIZE - 11) // 2, trash_y + (self.TRASH_SIZE - 11) // 2, trash_px)
 
         text_x = chip_x + self.CHIP_SIZE + self.PAD
@@ -151,43 +178,39 @@ class ComponentItemDelegate(QStyledItemDelegate):
             parts = name.split(': ', 1)
             display_type  = parts[0].strip()
             display_value = parts[1].strip()
-        type_font = QFont(); type_font.setPointSize(9); type_font.setWeight(QFont.DemiBold)
-        painter.setFont(type_font)
-        painter.setPen(QColor('#1E293B') if selected else QColor('#334155'))
+        painter.setFont(self._type_font)
+        painter.setPen(self._TEXT_SELECTED if selected else self._TEXT)
         if display_value:
-            type_fm = QFontMetrics(type_font)
             painter.drawText(
                 QRect(text_x, r.top() + 3, text_w, r.height() // 2),
                 Qt.AlignLeft | Qt.AlignBottom,
-                type_fm.elidedText(display_type, Qt.ElideRight, text_w),
+                self._type_fm.elidedText(display_type, Qt.ElideRight, text_w),
             )
-            value_font = QFont(); value_font.setPointSize(8)
-            painter.setFont(value_font)
-            painter.setPen(QColor('#94A3B8'))
-            value_fm = QFontMetrics(value_font)
+            painter.setFont(self._value_font)
+            painter.setPen(self._TEXT_MUTE)
             painter.drawText(
                 QRect(text_x, r.top() + r.height() // 2, text_w, r.height() // 2 - 3),
                 Qt.AlignLeft | Qt.AlignTop,
-                value_fm.elidedText(display_value, Qt.ElideRight, text_w),
+                self._value_fm.elidedText(display_value, Qt.ElideRight, text_w),
             )
         else:
-            type_fm = QFontMetrics(type_font)
             painter.drawText(
                 QRect(text_x, r.top(), text_w, r.height()),
                 Qt.AlignLeft | Qt.AlignVCenter,
-                type_fm.elidedText(display_type, Qt.ElideRight, text_w),
+                self._type_fm.elidedText(display_type, Qt.ElideRight, text_w),
             )
 
         if selected:
-            painter.setPen(QPen(QColor('#6366F1'), 1))
+            painter.setPen(QPen(self._OUTLINE, 1))
             painter.setBrush(Qt.NoBrush)
             painter.drawRoundedRect(r, 6, 6)
         painter.restore()
 
     def editorEvent(self, event, model, option, index):
         if event.type() == QEvent.MouseButtonRelease:
-            trash_rect = index.data(Qt.UserRole + 1)
-            if trash_rect and trash_rect.contains(event.pos()):
+            # Derived from the row geometry; paint() no longer stores it in the model
+            trash_rect = self._trash_rect(option.rect.adjusted(4, 2, -4, -2))
+            if trash_rect.contains(event.pos()):
                 lw = self.parent()
                 if hasattr(lw, 'delete_item_requested'):
                     lw.delete_item_requested.emit(index.row())
@@ -226,10 +249,18 @@ class DeleteSignalList(QListWidget):
 # ── Grid scene ────────────────────────────────────────────────────────────────
 
 class GridGraphicsScene(QGraphicsScene):
-    def __init__(self, rect, grid_size=20, color=QColor("#F1F4F8"), parent=None):
+    def __init__(self, rect, grid_size=20, color=QColor("#F1F4F8"), parent=None,
+                 index_method=QGraphicsScene.NoIndex):
         super().__init__(rect, parent)
+        # A label holds a few dozen items that are constantly dragged and
+        # resized; a linear scan beats keeping a BSP tree up to date.
+        self.setItemIndexMethod(index_method)
         self.grid_size  = grid_size
         self.grid_color = color
+        # Grid segments for the last (scene rect, grid size); the grid spans
+        # the whole scene, so it only changes when either of those does
+        self._line_cache: list[QLineF] = []
+        self._line_cache_key = None
 
     def drawBackground(self, painter, rect):
         super().drawBackground(painter, rect)
@@ -240,23 +271,33 @@ class GridGraphicsScene(QGraphicsScene):
         painter.drawRect(sr)
 
         painter.setPen(QPen(self.grid_color, 1))
+        painter.drawLines(self._grid_lines(sr))
+
+        painter.setPen(QPen(QColor("#94A3B8"), 1.5))
+        painter.setBrush(Qt.NoBrush)
+        painter.drawRect(sr)
+
+    def _grid_lines(self, sr: QRectF) -> list[QLineF]:
+        key = (sr.left(), sr.top(), sr.right(), sr.bottom(), self.grid_size)
+        if key == self._line_cache_key:
+            return self._line_cache
 
         left = int(sr.left()) - (int(sr.left()) % self.grid_size)
         top  = int(sr.top())  - (int(sr.top())  % self.grid_size)
 
+        lines = []
         x = left
         while x < sr.right():
-            painter.drawLine(QPointF(x, sr.top()), QPointF(x, sr.bottom()))
+            lines.append(QLineF(x, sr.top(), x, sr.bottom()))
             x += self.grid_size
 
         y = top
         while y < sr.bottom():
-            painter.drawLine(QPointF(sr.left(), y), QPointF(sr.right(), y))
+            lines.append(QLineF(sr.left(), y, sr.right(), y))
             y += self.grid_size
 
-        painter.setPen(QPen(QColor("#94A3B8"), 1.5))
-        painter.setBrush(Qt.NoBrush)
-        painter.drawRect(sr)
+        self._line_cache, self._line_cache_key = lines, key
+        return lines
 
 
 # ── Main page ─────────────────────────────────────────────────────────────────
@@ -1188,7 +1229,7 @@ class BarcodeEditorPage(QWidget):
         self.component_list.takeItem(row)
         self.scene.blockSignals(False); self.component_list.blockSignals(False)
         self.comp_count_badge.setText(str(self.component_list.count()))
-        self.on_selection_changed()
+        self.on_selection_changed(rebuild=True)
 
     def _delete_selected_item(self):
         if not self.view.isVisible() or self._tab_stack.currentIndex() != 1:
@@ -1228,28 +1269,32 @@ class BarcodeEditorPage(QWidget):
 
     def update_component_list(self):
         self.component_list.blockSignals(True)
+        sel = self.scene.selectedItems()
+        lead = sel[0] if sel else None
+        lead_row = None
+        existing = set()
         for i in range(self.component_list.count()):
             li = self.component_list.item(i)
             gi = getattr(li, 'graphics_item', None)
             if gi:
-                li.setText(self.get_component_display_name(gi))
-        existing = [
-            getattr(self.component_list.item(i), 'graphics_item', None)
-            for i in range(self.component_list.count())
-        ]
+                existing.add(gi)
+                # Only rows whose label actually changed are touched, so the
+                # view repaints just those instead of every row
+                text = self.get_component_display_name(gi)
+                if li.text() != text:
+                    li.setText(text)
+                if gi is lead and lead_row is None:
+                    lead_row = li
         for item in self.scene.items():
             if item.group() or item.scene() != self.scene or item in existing:
                 continue
             li = QListWidgetItem(self.get_component_display_name(item))
             li.graphics_item = item
             self.component_list.addItem(li)
-        sel = self.scene.selectedItems()
-        if sel:
-            for i in range(self.component_list.count()):
-                li = self.component_list.item(i)
-                if getattr(li, 'graphics_item', None) == sel[0]:
-                    self.component_list.setCurrentItem(li)
-                    break
+            if item is lead:
+                lead_row = li
+        if lead_row is not None and self.component_list.currentItem() is not lead_row:
+            self.component_list.setCurrentItem(lead_row)
         self.comp_count_badge.setText(str(self.component_list.count()))
         self.component_list.blockSignals(False)
         self._sync_same_with_items()
@@ -1333,12 +1378,25 @@ class BarcodeEditorPage(QWidget):
             self.scene.blockSignals(False)
             self.on_selection_changed()
 
-    def on_selection_changed(self):
+    def on_selection_changed(self, rebuild: bool = False):
         selected_items = self.scene.selectedItems()
+        editor = getattr(self, "current_editor", None)
+        if editor and not shiboken6.isValid(editor):
+            editor = None
+        # Rubber-band and Ctrl+click changes often keep the same lead item;
+        # its editor is still bound to it, so don't tear it down and rebuild.
+        if (not rebuild and editor is not None and selected_items
+                and getattr(editor, "item", None) is selected_items[0]):
+            return
+        # Land any spin change still queued in the outgoing editor
+        if editor is not None and hasattr(editor, "flush_pending_updates"):
+            editor.flush_pending_updates()
         while self.inspector_layout.count():
             child = self.inspector_layout.takeAt(0)
             if child.widget():
                 child.widget().deleteLater()
+        # The old editor is on its way out; never match against it again
+        self.current_editor = None
         if not selected_items:
             self.component_list.clearSelection()
             self.prop_name_input.setText("")
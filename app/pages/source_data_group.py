@@ -711,7 +711,7 @@ class SourceDataPage(QWidget):
             elif value == SOURCE_TYPE_TABLE:
                 query_widget = modal.inputs.get("query")
                 if query_widget:
-                    from PySide6.QtWidgets import QTextEdit as _QTE
+                    from PySide6.QtWidgets import QPlainTextEdit as _QTE
                     if isinstance(query_widget, _QTE):
                         query_widget.setPlainText("")
 